@@ -1,8 +1,12 @@
+import itertools
+
+import orjson
 import pandas as pd
-import json
+
+from dataset_io import read_dataset
 
 def analyze_dataset(csv_path="founders_dataset.csv"):
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
     
     print(f"Total rows: {len(df)}")
     print("-" * 50)
@@ -18,22 +22,25 @@ def analyze_dataset(csv_path="founders_dataset.csv"):
     
     for col in categorical_cols:
         if col in df.columns:
+            # Count once; derive proportions from the counts
+            counts = df[col].value_counts()
             print(f"\nDistribution for '{col}':")
-            print(df[col].value_counts(normalize=True).round(3))
-            print(f"Raw counts:\n{df[col].value_counts()}")
+            print((counts / counts.sum()).rename("proportion").round(3))
+            print(f"Raw counts:\n{counts}")
             print("-" * 30)
             
     # Parse and analyze list columns
     list_cols = ['roles']
     for col in list_cols:
         if col in df.columns:
-            # Parse JSON strings if necessary
-            parsed_series = df[col].apply(lambda x: json.loads(x) if isinstance(x, str) else x)
-            # Flatten list
-            all_items = [item for sublist in parsed_series for item in sublist]
+            # Parse JSON strings if necessary (one pass over the raw values)
+            parsed = [orjson.loads(x) if isinstance(x, (bytes, str)) else x for x in df[col].values]
+            # Flatten list and count once
+            all_items = list(itertools.chain.from_iterable(parsed))
+            counts = pd.Series(all_items).value_counts()
             print(f"\nDistribution for items in '{col}':")
-            print(pd.Series(all_items).value_counts(normalize=True).round(3))
-            print(f"Raw counts:\n{pd.Series(all_items).value_counts()}")
+            print((counts / len(all_items)).rename("proportion").round(3))
+            print(f"Raw counts:\n{counts}")
             print("-" * 30)
 
 if __name__ == "__main__":
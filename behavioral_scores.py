@@ -3,10 +3,14 @@ Behavioral score computation module using min-max normalization
 on Tinder engagement metrics.
 """
 
+import logging
+
 import pandas as pd
 import numpy as np
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 def safe_min_max_normalize(series: pd.Series, epsilon: float = 1e-10) -> pd.Series:
     """
@@ -19,21 +23,26 @@ def safe_min_max_normalize(series: pd.Series, epsilon: float = 1e-10) -> pd.Seri
     Returns:
         Normalized series in [0, 1] range
     """
-    # Fill NaN with 0
-    series = series.fillna(0)
+    # Fill NaN with 0 on a private float64 copy, then normalize in place
+    values = series.to_numpy(dtype=np.float64, copy=True)
+    np.nan_to_num(values, copy=False)
+    
+    if len(values) == 0:
+        return pd.Series(values, index=series.index)
     
-    min_val = series.min()
-    max_val = series.max()
+    min_val = values.min()
+    value_range = values.max() - min_val
     
     # Avoid division by zero
-    if max_val - min_val < epsilon:
+    if value_range < epsilon:
         # All values are the same, return 0.5 for all
-        return pd.Series([0.5] * len(series), index=series.index)
+        values.fill(0.5)
+    else:
+        # min <= x <= max, so the result is already within [0, 1]
+        values -= min_val
+        values /= value_range
     
-    normalized = (series - min_val) / (max_val - min_val)
-    
-    # Clip to [0, 1] just in case
-    return normalized.clip(0, 1)
+    return pd.Series(values, index=series.index)
 
 
 def compute_collaboration_openness_score(df: pd.DataFrame) -> pd.Series:
@@ -105,11 +114,122 @@ def compute_responsiveness_score(df: pd.DataFrame, epsilon: float = 1.0) -> pd.S
     return safe_min_max_normalize(raw_score)
 
 
-def compute_behavioral_scores(df: pd.DataFrame) -> pd.DataFrame:
+# Score columns produced by compute_behavioral_scores[_inplace], in output order
+SCORE_COLUMNS = [
+    'collaboration_openness_score',
+    'communication_intensity_score',
+    'responsiveness_score'
+]
+
+# Linear weights mapping the five engagement features to the three raw scores.
+# Rows follow get_required_columns(); the two day-based features are inverted
+# (1 / (days + epsilon)) before the product, as in compute_responsiveness_score.
+SCORE_WEIGHTS = np.array([
+    # collab  comm   resp
+    [0.5,     0.0,   0.0],   # sum_app_opens
+    [0.5,     0.7,   0.0],   # nrOfConversations
+    [0.0,     0.3,   0.0],   # averageConversationLength
+    [0.0,     0.0,   1.0],   # 1 / (averageConversationLengthInDays + eps)
+    [0.0,     0.0,   0.5],   # 1 / (longestConversationInDays + eps)
+], dtype=np.float64)
+
+
+def compute_score_matrix(
+    df: pd.DataFrame,
+    responsiveness_epsilon: float = 1.0,
+    epsilon: float = 1e-10
+) -> np.ndarray:
+    """
+    Compute all three normalized behavioral scores in one vectorized pass.
+    
+    Equivalent to the three compute_*_score functions, but extracts the
+    engagement columns into a single float64 array and works on it in place
+    instead of building intermediate Series per score.
+    
+    Args:
+        df: DataFrame with the columns from get_required_columns()
+        responsiveness_epsilon: Offset added to day counts before inversion
+        epsilon: Small value to avoid division by zero in normalization
+    
+    Returns:
+        (N, 3) float64 array of scores in [0, 1], columns as SCORE_COLUMNS
+    """
+    arr = df[get_required_columns()].to_numpy(dtype=np.float64, copy=True)
+    np.nan_to_num(arr, copy=False)
+    
+    # Inverse relationship for the time-based features: shorter time = higher score
+    days = arr[:, 3:]
+    days += responsiveness_epsilon
+    np.reciprocal(days, out=days)
+    
+    raw = arr @ SCORE_WEIGHTS
+    if len(raw) == 0:
+        return raw
+    
+    # Min-max normalize each column; constant columns map to 0.5
+    mn = raw.min(axis=0)
+    rng = raw.max(axis=0) - mn
+    raw -= mn
+    raw /= np.maximum(rng, epsilon)
+    return np.where(rng < epsilon, 0.5, raw)
+
+
+def compute_behavioral_scores_polars(
+    df: pd.DataFrame,
+    responsiveness_epsilon: float = 1.0,
+    epsilon: float = 1e-10
+) -> pd.DataFrame:
     """
-    Compute all behavioral scores and add them to the DataFrame.
+    Compute all three normalized behavioral scores with a Polars lazy query.
     
-    This function adds three new columns:
+    Only the engagement columns are handed to Polars; the fill, weighting and
+    min-max steps are fused into one multi-threaded query.
+    
+    Args:
+        df: DataFrame with the columns from get_required_columns()
+        responsiveness_epsilon: Offset added to day counts before inversion
+        epsilon: Small value to avoid division by zero in normalization
+    
+    Returns:
+        DataFrame with the SCORE_COLUMNS, indexed like df
+    """
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError("engine='polars' requires polars. Please run: pip install polars") from e
+    
+    def feature(name: str) -> "pl.Expr":
+        return pl.col(name).cast(pl.Float64).fill_nan(0).fill_null(0)
+    
+    def normalize(name: str) -> "pl.Expr":
+        col = pl.col(name)
+        span = col.max() - col.min()
+        return pl.when(span < epsilon).then(0.5).otherwise((col - col.min()) / span).alias(name)
+    
+    lf = pl.from_pandas(df[get_required_columns()]).lazy()
+    scores = (
+        lf.select(
+            (0.5 * feature('sum_app_opens') + 0.5 * feature('nrOfConversations'))
+                .alias('collaboration_openness_score'),
+            (0.7 * feature('nrOfConversations') + 0.3 * feature('averageConversationLength'))
+                .alias('communication_intensity_score'),
+            (1.0 / (feature('averageConversationLengthInDays') + responsiveness_epsilon)
+                + 0.5 / (feature('longestConversationInDays') + responsiveness_epsilon))
+                .alias('responsiveness_score'),
+        )
+        .select([normalize(name) for name in SCORE_COLUMNS])
+        .collect()
+    )
+    
+    return pd.DataFrame(scores.to_numpy(), columns=SCORE_COLUMNS, index=df.index)
+
+
+def compute_behavioral_scores_inplace(df: pd.DataFrame, engine: str = "numpy") -> pd.DataFrame:
+    """
+    Compute all behavioral scores and add them to the DataFrame in place.
+    
+    This function adds three new columns to `df` (the caller's frame is
+    modified; no copy is made):
     - collaboration_openness_score
     - communication_intensity_score
     - responsiveness_score
@@ -121,21 +241,39 @@ def compute_behavioral_scores(df: pd.DataFrame) -> pd.DataFrame:
             - averageConversationLength
             - averageConversationLengthInDays
             - longestConversationInDays
+        engine: "numpy" (default) or "polars" (requires the polars package)
     
     Returns:
-        DataFrame with added behavioral score columns
+        The same DataFrame, with the behavioral score columns added
     """
-    # Make a copy to avoid modifying the original
-    df = df.copy()
-    
-    # Compute each score
-    df['collaboration_openness_score'] = compute_collaboration_openness_score(df)
-    df['communication_intensity_score'] = compute_communication_intensity_score(df)
-    df['responsiveness_score'] = compute_responsiveness_score(df)
+    # Compute all scores in one vectorized pass
+    if engine == "numpy":
+        df[SCORE_COLUMNS] = compute_score_matrix(df)
+    elif engine == "polars":
+        df[SCORE_COLUMNS] = compute_behavioral_scores_polars(df).to_numpy()
+    else:
+        raise ValueError(f"Unknown engine '{engine}', expected 'numpy' or 'polars'")
     
     return df
 
 
+def compute_behavioral_scores(df: pd.DataFrame, engine: str = "numpy") -> pd.DataFrame:
+    """
+    Compute all behavioral scores on a copy of the DataFrame.
+    
+    Non-mutating wrapper around compute_behavioral_scores_inplace; use that
+    directly when the input frame is not needed afterwards.
+    
+    Args:
+        df: DataFrame with the required engagement columns
+        engine: "numpy" (default) or "polars" (requires the polars package)
+    
+    Returns:
+        New DataFrame with added behavioral score columns
+    """
+    return compute_behavioral_scores_inplace(df.copy(), engine=engine)
+
+
 def get_required_columns() -> list:
     """
     Get list of required columns for behavioral score computation.
@@ -166,7 +304,7 @@ def validate_required_columns(df: pd.DataFrame) -> bool:
     missing = [col for col in required if col not in df.columns]
     
     if missing:
-        print(f"Warning: Missing required columns: {missing}")
+        logger.warning("Missing required columns: %s", missing)
         return False
     
     return True
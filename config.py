@@ -79,3 +79,21 @@ PERSONALITY_TRAITS = [
     "execution_speed"
 ]
 
+
+# Hashed / immutable views of the vocabularies for O(1) membership checks
+ALLOWED_ROLES_SET = frozenset(ALLOWED_ROLES)
+ALLOWED_INDUSTRIES_SET = frozenset(ALLOWED_INDUSTRIES)
+STRENGTHS_VOCAB_SET = frozenset(STRENGTHS_VOCAB)
+WEAKNESSES_VOCAB_SET = frozenset(WEAKNESSES_VOCAB)
+PERSONALITY_TRAITS_TUPLE = tuple(PERSONALITY_TRAITS)
+
+# On-disk cache of LLM responses (SQLite), keyed by prompt hash
+LLM_CACHE_PATH = "llm_cache.sqlite"
+
+# Multi-profile LLM requests: profiles per request, and the prompt length
+# (characters) beyond which a batch falls back to one request per profile
+LLM_BATCH_SIZE = 10
+MAX_BATCH_PROMPT_CHARS = 40000
+
+# Rows whose single-profile prompts are rendered per vectorized step
+PROMPT_CHUNK_SIZE = 256
@@ -0,0 +1,222 @@
+"""
+Fast CSV / Parquet reading and writing helpers built on PyArrow.
+"""
+
+import csv
+import logging
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+
+def is_parquet_path(path: str) -> bool:
+    """
+    Check whether a path refers to a Parquet file (by extension).
+
+    Args:
+        path: File path
+
+    Returns:
+        True for .parquet / .pq paths
+    """
+    return path.lower().endswith((".parquet", ".pq"))
+
+
+def read_csv_fast(path: str, delimiter: str = ",") -> pd.DataFrame:
+    """
+    Read a CSV file with PyArrow's multi-threaded parser.
+
+    Values match pd.read_csv for the pipeline's files: numpy-backed columns,
+    object dtype for strings, empty cells read as missing and date-like
+    columns (e.g. birthDate) kept as their original text.
+
+    Args:
+        path: Path to the CSV file
+        delimiter: Field separator
+
+    Returns:
+        Loaded DataFrame
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=32 << 20)
+    # Bios and generated descriptions may contain quoted newlines
+    parse_options = pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True)
+    convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+
+    # Arrow infers date/timestamp columns from the first block; read those as strings
+    inferred = pa_csv.open_csv(
+        path, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+    ).schema
+    convert_options.column_types = {
+        field.name: pa.string() for field in inferred if pa.types.is_temporal(field.type)
+    }
+
+    table = pa_csv.read_csv(
+        path, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+    )
+    return table.to_pandas()
+
+
+def read_dataset(path: str, delimiter: str = ",") -> pd.DataFrame:
+    """
+    Read a dataset from Parquet or CSV, chosen by file extension.
+
+    Args:
+        path: Path to the .parquet or .csv file
+        delimiter: Field separator for CSV files
+
+    Returns:
+        Loaded DataFrame
+    """
+    if is_parquet_path(path):
+        return pq.read_table(path).to_pandas()
+    return read_csv_fast(path, delimiter=delimiter)
+
+
+def _coerce_to_schema(row: Dict[str, Any], schema: pa.Schema) -> Dict[str, Any]:
+    """
+    Make a row's values convertible to the given Arrow schema.
+
+    NaN becomes null, and values of string / list-of-string fields are
+    stringified, since LLM output is not guaranteed to be well typed.
+
+    Args:
+        row: Row dictionary
+        schema: Target Arrow schema
+
+    Returns:
+        New dictionary restricted to the schema's fields
+    """
+    coerced = {}
+    for field in schema:
+        value = row.get(field.name)
+        if isinstance(value, float) and math.isnan(value):
+            value = None
+        elif value is not None and pa.types.is_string(field.type) and not isinstance(value, str):
+            value = str(value)
+        elif isinstance(value, list) and pa.types.is_list(field.type) and pa.types.is_string(field.type.value_type):
+            value = [v if isinstance(v, str) else str(v) for v in value]
+        coerced[field.name] = value
+    return coerced
+
+
+class StreamingDatasetWriter:
+    """
+    Append rows to a CSV or Parquet file (chosen by extension) as they are produced.
+
+    Rows are written with a fixed column order; keys not in `columns` are
+    ignored and missing keys (or NaN values) are left empty. CSV rows are
+    flushed to disk every `flush_every` rows; Parquet rows are buffered and
+    written as one row group per `flush_every` rows. Buffered rows that
+    cannot be converted to the Parquet schema are logged, skipped and
+    counted in `rows_failed`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: Sequence[str],
+        parquet_schema: Optional[pa.Schema] = None,
+        flush_every: int = 100
+    ):
+        """
+        Open the output file and write the CSV header.
+
+        Args:
+            path: Output .csv or .parquet path
+            columns: Column names, in output order
+            parquet_schema: Arrow schema for Parquet output (required for .parquet)
+            flush_every: Rows between flushes / row groups
+        """
+        self.path = path
+        self.columns = list(columns)
+        self.flush_every = flush_every
+        self.rows_written = 0
+        self.rows_failed = 0
+        self._buffer: List[Dict[str, Any]] = []
+
+        if is_parquet_path(path):
+            if parquet_schema is None:
+                raise ValueError("parquet_schema is required for Parquet output")
+            self._schema = parquet_schema
+            self._parquet_writer = pq.ParquetWriter(path, parquet_schema, compression="zstd")
+            self._file = None
+        else:
+            self._schema = None
+            self._parquet_writer = None
+            self._file = open(path, "w", newline="", encoding="utf-8")
+            self._csv_writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+            self._csv_writer.writeheader()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """
+        Append one row.
+
+        Args:
+            row: Row dictionary keyed by column name
+        """
+        if self._parquet_writer is not None:
+            self._buffer.append(_coerce_to_schema(row, self._schema))
+            if len(self._buffer) >= self.flush_every:
+                self.flush()
+        else:
+            self._csv_writer.writerow(
+                {key: None if isinstance(value, float) and math.isnan(value) else value for key, value in row.items()}
+            )
+            if (self.rows_written + 1) % self.flush_every == 0:
+                self._file.flush()
+        self.rows_written += 1
+
+    def flush(self) -> None:
+        """Write buffered rows (Parquet) or flush the file (CSV) to disk."""
+        if self._parquet_writer is not None:
+            if self._buffer:
+                self._parquet_writer.write_table(self._buffer_to_table())
+                self._buffer = []
+        else:
+            self._file.flush()
+
+    def _buffer_to_table(self) -> pa.Table:
+        """
+        Convert the buffered Parquet rows, dropping any the schema rejects.
+
+        Returns:
+            Table of the convertible rows
+        """
+        try:
+            return pa.Table.from_pylist(self._buffer, schema=self._schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+
+        # Rare: find the offending rows one by one
+        batches = []
+        for row in self._buffer:
+            try:
+                batches.append(pa.RecordBatch.from_pylist([row], schema=self._schema))
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                logger.warning("Skipping row %s that does not fit the Parquet schema: %s", row.get("founder_id"), e)
+                self.rows_written -= 1
+                self.rows_failed += 1
+        return pa.Table.from_batches(batches, schema=self._schema)
+
+    def close(self) -> None:
+        """Flush remaining rows and close the file."""
+        self.flush()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        else:
+            self._file.close()
+
+    def __enter__(self) -> "StreamingDatasetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
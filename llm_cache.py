@@ -0,0 +1,165 @@
+"""
+Disk-persistent cache for LLM responses, keyed by a hash of the prompt.
+
+Reruns (e.g. after a crash) and duplicate prompts are served from a local
+SQLite database instead of paying another API round-trip.
+"""
+
+import functools
+import hashlib
+import inspect
+import sqlite3
+import threading
+from typing import Callable, Optional
+
+from config import LLM_CACHE_PATH
+
+
+def prompt_hash(prompt: str) -> bytes:
+    """
+    Compute the cache key for a prompt.
+
+    Args:
+        prompt: The prompt string sent to the LLM
+
+    Returns:
+        16-byte BLAKE2b digest of the UTF-8 encoded prompt
+    """
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+
+
+class ResponseCache:
+    """
+    Thread-safe SQLite store mapping prompt hashes to LLM responses.
+    """
+
+    def __init__(self, path: str = LLM_CACHE_PATH):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache(hash BLOB PRIMARY KEY, response TEXT)"
+            )
+            self._conn.commit()
+
+    def get(self, prompt: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            prompt: The prompt string
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        h = prompt_hash(prompt)
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM cache WHERE hash=?", (h,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, prompt: str, response: str) -> None:
+        """
+        Store a response for a prompt (first write wins).
+
+        Args:
+            prompt: The prompt string
+            response: The LLM response to cache
+        """
+        h = prompt_hash(prompt)
+        with self._lock:
+            self._conn.execute("INSERT OR IGNORE INTO cache(hash, response) VALUES (?, ?)", (h, response))
+            self._conn.commit()
+
+    def delete(self, prompt: str) -> None:
+        """
+        Drop the cached response for a prompt, if any.
+
+        Used when a cached response turns out to be unusable (e.g. it fails
+        to parse), so that the next run asks the LLM again.
+
+        Args:
+            prompt: The prompt string
+        """
+        h = prompt_hash(prompt)
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE hash=?", (h,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> ResponseCache:
+    """
+    Return the process-wide cache, opening it on first use.
+
+    Returns:
+        Shared ResponseCache instance backed by LLM_CACHE_PATH
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
+
+
+def cached_llm_call(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    Decorator that consults the response cache before calling the LLM.
+
+    The wrapped function must take the prompt as its first argument and
+    return the response text. Coroutine functions are supported. Pass
+    `use_cache=False` to bypass the cache. Every response is stored; callers
+    that reject a response should evict it with ResponseCache.delete.
+
+    Args:
+        func: LLM call function to wrap
+
+    Returns:
+        Wrapped function with the same signature plus `use_cache`
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(prompt: str, *args, use_cache: bool = True, **kwargs) -> str:
+            if not use_cache:
+                return await func(prompt, *args, **kwargs)
+
+            cache = get_default_cache()
+            cached = cache.get(prompt)
+            if cached is not None:
+                return cached
+
+            response = await func(prompt, *args, **kwargs)
+            cache.set(prompt, response)
+            return response
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(prompt: str, *args, use_cache: bool = True, **kwargs) -> str:
+        if not use_cache:
+            return func(prompt, *args, **kwargs)
+
+        cache = get_default_cache()
+        cached = cache.get(prompt)
+        if cached is not None:
+            return cached
+
+        response = func(prompt, *args, **kwargs)
+        cache.set(prompt, response)
+        return response
+
+    return wrapper
@@ -2,10 +2,25 @@
 LLM client module using OpenAI's ChatGPT.
 """
 
-from openai import OpenAI
-import time
-import random
+from openai import OpenAI, AsyncOpenAI
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
+import asyncio
+import concurrent.futures
+import json
+import logging
 import os
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Sequence, TypeVar
+
+from llm_cache import cached_llm_call, get_default_cache
 
 # Configure the API key from environment variable
 # Set OPENAI_API_KEY environment variable before running
@@ -13,49 +28,347 @@ API_KEY = os.environ.get("OPENAI_API_KEY")
 if not API_KEY:
     raise ValueError("OPENAI_API_KEY environment variable is not set. Please set it before running the pipeline.")
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 client = OpenAI(api_key=API_KEY)
 
+# Shared, read-only system message sent with every request
+_SYSTEM_MSG = {"role": "system", "content": "You are a helpful assistant that generates structured JSON."}
+
+
+def new_async_client() -> AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client for one pipeline run.
+
+    Its connection pool is bound to the event loop it is first used on, so
+    each asyncio.run needs its own client; use it as `async with
+    new_async_client() as async_client:` inside the top-level coroutine.
+
+    Returns:
+        A new AsyncOpenAI client
+    """
+    return AsyncOpenAI(api_key=API_KEY)
+
+
+def _is_retryable_error(e: BaseException) -> bool:
+    """
+    Check whether an API error is a rate limit or transient server error.
+
+    Args:
+        e: Exception raised by the OpenAI client
+
+    Returns:
+        True if the call should be retried
+    """
+    error_str = str(e).lower()
+    return "429" in error_str or "500" in error_str or "503" in error_str
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    """
+    Log a retryable error and the backoff before the next attempt.
+
+    Args:
+        retry_state: tenacity state for the failed attempt
+    """
+    logger.warning(
+        "OpenAI error %s. Retrying in %.2fs... (Attempt %d/%d)",
+        retry_state.outcome.exception(),
+        retry_state.next_action.sleep,
+        retry_state.attempt_number,
+        retry_state.retry_object.stop.max_attempt_number - 1,
+    )
+
+
+def _retry_kwargs(retries: int, initial_delay: float) -> Dict[str, Any]:
+    """
+    Build the shared tenacity policy: exponential backoff with jitter on 429/5xx.
+
+    Each retry is logged as a warning with the error and the backoff delay.
+
+    Args:
+        retries: Number of retries for rate limit errors
+        initial_delay: Initial delay in seconds for backoff
+
+    Returns:
+        Keyword arguments for Retrying / AsyncRetrying
+    """
+    return dict(
+        retry=retry_if_exception(_is_retryable_error),
+        stop=stop_after_attempt(retries + 1),
+        wait=wait_exponential(multiplier=initial_delay) + wait_random(0, 1),
+        before_sleep=_log_retry,
+        reraise=True,
+    )
+
+
+def _request_kwargs(prompt: str) -> Dict[str, Any]:
+    """
+    Build the Chat Completions request body for a prompt.
+
+    Args:
+        prompt: The formatted prompt string to send to the LLM
+
+    Returns:
+        Keyword arguments for chat.completions.create
+    """
+    return dict(
+        model="gpt-4o-mini",  # Using gpt-4o-mini for speed and cost efficiency
+        messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}],
+        response_format={"type": "json_object"},  # Force JSON output
+        temperature=0.7,
+    )
+
+
+@cached_llm_call
 def call_llm(prompt: str, retries: int = 5, initial_delay: float = 2.0) -> str:
     """
     Call OpenAI's ChatGPT model with the given prompt.
-    Includes retry logic for rate limits.
-    
+    Includes retry logic for rate limits. Responses are cached on disk by
+    prompt hash; pass use_cache=False to force a fresh call.
+
     Args:
         prompt: The formatted prompt string to send to the LLM
         retries: Number of retries for rate limit errors
         initial_delay: Initial delay in seconds for backoff
-    
+
     Returns:
         The LLM's response as a string
-        
+
     Raises:
         Exception: If the API call fails
     """
-    delay = initial_delay
-    
-    for attempt in range(retries + 1):
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",  # Using gpt-4o-mini for speed and cost efficiency
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that generates structured JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},  # Force JSON output
-                temperature=0.7,
+    try:
+        for attempt in Retrying(**_retry_kwargs(retries, initial_delay)):
+            with attempt:
+                response = client.chat.completions.create(**_request_kwargs(prompt))
+        return response.choices[0].message.content
+    except Exception as e:
+        # Raise for other errors or if retries exhausted
+        raise RuntimeError(f"OpenAI API call failed: {str(e)}") from e
+
+
+@cached_llm_call
+async def call_llm_async(
+    prompt: str,
+    async_client: AsyncOpenAI,
+    retries: int = 5,
+    initial_delay: float = 2.0
+) -> str:
+    """
+    Asynchronously call OpenAI's ChatGPT model with the given prompt.
+
+    Same retry and caching behavior as call_llm, but many calls can be in
+    flight at once on a single event loop.
+
+    Args:
+        prompt: The formatted prompt string to send to the LLM
+        async_client: Client created on the running event loop (see new_async_client)
+        retries: Number of retries for rate limit errors
+        initial_delay: Initial delay in seconds for backoff
+
+    Returns:
+        The LLM's response as a string
+
+    Raises:
+        Exception: If the API call fails
+    """
+    try:
+        async for attempt in AsyncRetrying(**_retry_kwargs(retries, initial_delay)):
+            with attempt:
+                response = await async_client.chat.completions.create(**_request_kwargs(prompt))
+        return response.choices[0].message.content
+    except Exception as e:
+        # Raise for other errors or if retries exhausted
+        raise RuntimeError(f"OpenAI API call failed: {str(e)}") from e
+
+
+async def _submit_batch_async(
+    prompts: Sequence[str],
+    batch_size: int,
+    max_concurrency: int
+) -> List[Optional[str]]:
+    """
+    Coroutine behind submit_batch.
+    
+    Args:
+        prompts: Prompt strings
+        batch_size: Maximum number of scheduled (pending or in-flight) calls
+        max_concurrency: Maximum number of in-flight requests
+    
+    Returns:
+        Responses aligned with prompts (None for failed calls)
+    """
+    sema = asyncio.Semaphore(max_concurrency)
+    responses: List[Optional[str]] = [None] * len(prompts)
+    
+    async with new_async_client() as async_client:
+        async def call(index: int, prompt: str) -> None:
+            async with sema:
+                try:
+                    responses[index] = await call_llm_async(prompt, async_client)
+                except Exception as e:
+                    logger.warning("LLM call failed in batch submission: %s", e)
+        
+        # Sliding window: schedule the next prompt as soon as any call finishes,
+        # so a slow request never holds back the rest of a chunk
+        scheduled: set = set()
+        for index, prompt in enumerate(prompts):
+            if len(scheduled) >= batch_size:
+                _, scheduled = await asyncio.wait(scheduled, return_when=asyncio.FIRST_COMPLETED)
+            scheduled.add(asyncio.ensure_future(call(index, prompt)))
+        if scheduled:
+            await asyncio.wait(scheduled)
+    return responses
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    Uses asyncio.run, unless an event loop is already running in this
+    thread (e.g. in a Jupyter/IPython kernel), where asyncio.run would
+    raise; the coroutine then runs on its own loop in a worker thread.
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def submit_batch(
+    prompts: Sequence[str],
+    batch_size: int = 256,
+    max_concurrency: int = 50
+) -> List[Optional[str]]:
+    """
+    Send many prompts as concurrent real-time requests and collect the responses.
+    
+    Prompts are scheduled on one event loop through a sliding window of
+    `batch_size` tasks with at most `max_concurrency` calls in flight, and
+    go through the same retry and response cache as call_llm_async. Use
+    run_batch_job instead when results are not needed right away. Safe to
+    call from a notebook, where an event loop is already running.
+    
+    Args:
+        prompts: Prompt strings
+        batch_size: Maximum number of scheduled (pending or in-flight) calls
+        max_concurrency: Maximum number of in-flight requests
+    
+    Returns:
+        Responses aligned with prompts (None for failed calls)
+    """
+    return run_sync(_submit_batch_async(list(prompts), batch_size, max_concurrency))
+
+
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def _read_batch_file(file_id: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Download a Batch API result file and decode its JSONL records.
+
+    Args:
+        file_id: Output or error file id of a batch (None if the batch has none)
+
+    Returns:
+        One record per non-empty line (empty if file_id is None)
+    """
+    if not file_id:
+        return []
+    text = client.files.content(file_id).text
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def run_batch_job(
+    prompts: Dict[str, str],
+    requests_path: str = "batch_requests.jsonl",
+    poll_interval: float = 30.0
+) -> Dict[str, str]:
+    """
+    Run prompts through the OpenAI Batch API (/v1/batches).
+
+    Batch jobs complete within 24h at half the real-time price and are not
+    subject to the real-time rate limits, which suits one-shot bulk builds.
+    Prompts already in the response cache are not resubmitted, and new
+    responses are written to the cache.
+
+    Args:
+        prompts: Mapping of unique custom_id to prompt string
+        requests_path: Path for the JSONL request file uploaded to OpenAI
+        poll_interval: Seconds between batch status checks
+
+    Returns:
+        Mapping of custom_id to response text for every successful request
+        (failed requests, from the output or the error file, are logged and
+        left out)
+
+    Raises:
+        RuntimeError: If the batch job fails, expires or is cancelled
+    """
+    cache = get_default_cache()
+    results: Dict[str, str] = {}
+    pending: Dict[str, str] = {}
+    for custom_id, prompt in prompts.items():
+        cached = cache.get(prompt)
+        if cached is not None:
+            results[custom_id] = cached
+        else:
+            pending[custom_id] = prompt
+
+    if not pending:
+        return results
+
+    with open(requests_path, "w", encoding="utf-8") as f:
+        for custom_id, prompt in pending.items():
+            line = {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": _request_kwargs(prompt),
+            }
+            f.write(json.dumps(line) + "\n")
+
+    with open(requests_path, "rb") as f:
+        batch_file = client.files.create(file=f, purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    print(f"Submitted batch {batch.id} with {len(pending)} requests")
+
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+
+    # Successful requests land in the output file and failed ones in the
+    # error file; either is missing when it would be empty
+    for record in _read_batch_file(batch.output_file_id) + _read_batch_file(batch.error_file_id):
+        custom_id = record["custom_id"]
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            logger.warning(
+                "Batch request %s failed (status %s): %s",
+                custom_id, response.get("status_code"), record.get("error") or response.get("body")
             )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            error_str = str(e).lower()
-            # Check for rate limit or server errors
-            if "429" in error_str or "500" in error_str or "503" in error_str:
-                if attempt < retries:
-                    sleep_time = delay * (2 ** attempt) + random.uniform(0, 1)
-                    print(f"OpenAI error {e}. Retrying in {sleep_time:.2f}s... (Attempt {attempt+1}/{retries})")
-                    time.sleep(sleep_time)
-                    continue
-            
-            # Raise for other errors or if retries exhausted
-            raise RuntimeError(f"OpenAI API call failed: {str(e)}") from e
+            continue
+        content = response["body"]["choices"][0]["message"]["content"]
+        cache.set(pending[custom_id], content)
+        results[custom_id] = content
+
+    return results
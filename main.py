@@ -6,133 +6,677 @@ computes behavioral scores, and outputs a structured founders dataset.
 """
 
 import pandas as pd
-import json
-from typing import Optional, Dict, Any
+import numpy as np
+import pyarrow as pa
+import orjson
+from typing import Optional, Dict, Any, List, Tuple, Awaitable, Iterator
 from tqdm import tqdm
-import concurrent.futures
+import asyncio
+import itertools
+import logging
+import logging.handlers
+import queue
 import random
 
-from prompts import build_prompt
-from llm_client import call_llm
-from parser import parse_founder_json
-from behavioral_scores import compute_behavioral_scores, validate_required_columns
-from config import PERSONALITY_TRAITS, ALLOWED_ROLES, ALLOWED_INDUSTRIES
+from prompts import PROFILE_FIELD_DEFAULTS, build_prompt, build_batch_prompt, iter_prompts
+from openai import AsyncOpenAI
+from llm_client import call_llm, call_llm_async, new_async_client, run_batch_job, run_sync
+from llm_cache import get_default_cache
+from parser import parse_founder_json, parse_founder_batch_json
+from dataset_io import StreamingDatasetWriter, is_parquet_path, read_csv_fast, read_dataset
+from behavioral_scores import SCORE_COLUMNS, compute_behavioral_scores_inplace, validate_required_columns
+from config import (
+    PERSONALITY_TRAITS,
+    ALLOWED_ROLES,
+    ALLOWED_INDUSTRIES,
+    LLM_BATCH_SIZE,
+    MAX_BATCH_PROMPT_CHARS,
+    PROMPT_CHUNK_SIZE
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Founder fields holding lists (stored as JSON strings in CSV output)
+LIST_FIELDS = ('roles', 'secondary_industries', 'tech_stack', 'strengths', 'weaknesses')
+
+# Output columns, in file order (validated LLM fields, identity, scores, traits)
+FOUNDER_COLUMNS = [
+    'roles', 'preferred_role', 'industry', 'secondary_industries',
+    'years_of_experience', 'is_technical', 'education_level', 'tech_stack',
+    'strengths', 'weaknesses', 'idea_title', 'idea_description', 'problem_space',
+    'founder_id', 'age', 'gender'
+] + SCORE_COLUMNS + PERSONALITY_TRAITS
+
+# Arrow schema for Parquet output; list fields are stored natively, other
+# fields not listed in _PARQUET_TYPES are strings
+_PARQUET_TYPES = {
+    'years_of_experience': pa.int64(),
+    'is_technical': pa.bool_(),
+    'age': pa.int64(),
+    **{col: pa.float64() for col in SCORE_COLUMNS},
+    **{trait: pa.int64() for trait in PERSONALITY_TRAITS},
+}
+FOUNDER_PARQUET_SCHEMA = pa.schema([
+    (col, pa.list_(pa.string()) if col in LIST_FIELDS else _PARQUET_TYPES.get(col, pa.string()))
+    for col in FOUNDER_COLUMNS
+])
+
+# Tinder columns read by process_single_founder; rows are passed around as plain dicts
+PROCESS_COLUMNS = ['_id', 'bio', 'jobTitle', 'user_age', 'gender'] + SCORE_COLUMNS
+
+# Tinder columns feeding the prompt's (bio, job_title, age, gender)
+PROMPT_INPUT_COLUMNS = ('bio', 'jobTitle', 'user_age', 'gender')
+
+
+def configure_logging(level: int = logging.WARNING) -> logging.handlers.QueueListener:
+    """
+    Send log records through an in-memory queue drained by a background thread.
+    
+    Workers only enqueue records, so per-row warnings never contend for the
+    stderr lock with each other or with the progress bar. The HTTP client
+    loggers stay at WARNING whatever the level, since they log every request.
+    
+    Args:
+        level: Root logger level
+    
+    Returns:
+        The started QueueListener; call .stop() to flush it on exit
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    for name in ("httpx", "httpcore", "openai"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    listener.start()
+    return listener
+
+
+def add_row_fields(founder_data: Dict[str, Any], row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Attach identity fields and behavioral scores from a Tinder row in-place.
+    
+    Args:
+        founder_data: Parsed founder profile dictionary
+        row: Dict with Tinder profile data (see PROCESS_COLUMNS)
+    
+    Returns:
+        The same founder_data dictionary, for chaining
+    """
+    # Add identity fields
+    founder_data['founder_id'] = row.get('_id', '')
+    founder_data['age'] = row.get('user_age', 0)
+    founder_data['gender'] = row.get('gender', '')
+    
+    # Add behavioral scores
+    founder_data['collaboration_openness_score'] = row.get('collaboration_openness_score', 0.5)
+    founder_data['communication_intensity_score'] = row.get('communication_intensity_score', 0.5)
+    founder_data['responsiveness_score'] = row.get('responsiveness_score', 0.5)
+    
+    return founder_data
+
+
+def _clean_prompt_column(df: pd.DataFrame, column: str, default: str, null_tokens: frozenset) -> np.ndarray:
+    """
+    Replace missing values in one prompt input column with its placeholder.
+    
+    Same rule as the prompt builder's per-value cleaning: falsy, blank and
+    null-token values (e.g. 'nan') become `default`; others are kept as is.
+    
+    Args:
+        df: Tinder DataFrame
+        column: Column name (a missing column is all placeholders)
+        default: Placeholder for missing values
+        null_tokens: Lowercased values treated as missing
+    
+    Returns:
+        Object array of cleaned values, aligned with df
+    """
+    if column not in df.columns:
+        return np.full(len(df), default, dtype=object)
+    
+    values = df[column].astype(object)
+    # NaN/None/NA stay missing under astype(str) in recent pandas, so test them directly
+    na = values.isna()
+    present = values.where(~na, '')
+    text = present.astype(str).str.strip().str.lower()
+    missing = na | ~present.astype(bool) | (text == '') | text.isin(null_tokens)
+    return values.where(~missing, default).to_numpy()
+
+
+def prepare_rows(df: pd.DataFrame) -> List[Tuple[Any, Any, Any, Any]]:
+    """
+    Clean the prompt input columns column-wise and return one tuple per row.
+    
+    The tuples can be passed to the prompt builders with assume_clean=True.
+    
+    Args:
+        df: Tinder DataFrame
+    
+    Returns:
+        List of cleaned (bio, job_title, age, gender) tuples, aligned with df
+    """
+    columns = [
+        _clean_prompt_column(df, column, default, null_tokens)
+        for column, (default, null_tokens) in zip(PROMPT_INPUT_COLUMNS, PROFILE_FIELD_DEFAULTS)
+    ]
+    return list(zip(*columns))
+
+
+def row_prompt_inputs(row: Dict[str, Any]) -> Tuple[Any, Any, Any, Any]:
+    """
+    Extract the prompt input fields from a Tinder profile row.
+    
+    Args:
+        row: Dict with Tinder profile data (see PROCESS_COLUMNS)
+    
+    Returns:
+        Tuple of (bio, job_title, age, gender)
+    """
+    return (
+        row.get('bio', ''),
+        row.get('jobTitle', ''),
+        row.get('user_age', 0),
+        row.get('gender', '')
+    )
+
+
+def build_row_prompt(
+    row: Dict[str, Any], 
+    suggested_role: Optional[str] = None, 
+    suggested_industry: Optional[str] = None,
+    rng: Optional[random.Random] = None
+) -> str:
+    """
+    Build the LLM prompt for a single Tinder profile row.
+    
+    Args:
+        row: Dict with Tinder profile data (see PROCESS_COLUMNS)
+        suggested_role: Optional suggested role (soft hint for distribution)
+        suggested_industry: Optional suggested industry (soft hint for distribution)
+        rng: Optional random generator for the prompt's example values
+    
+    Returns:
+        Formatted prompt string
+    """
+    # Extract input fields
+    bio, job_title, age, gender = row_prompt_inputs(row)
+    
+    # Build prompt with suggested soft hints
+    return build_prompt(
+        bio, 
+        job_title, 
+        age, 
+        gender, 
+        suggested_role=suggested_role, 
+        suggested_industry=suggested_industry,
+        rng=rng
+    )
+
+
+def parse_row_response(
+    response: str, 
+    row: Dict[str, Any], 
+    prompt: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Parse an LLM response and attach the row's identity fields and scores.
+    
+    Args:
+        response: Raw LLM response text
+        row: Dict with Tinder profile data (see PROCESS_COLUMNS)
+        prompt: Optional prompt the response was generated for; if parsing
+            fails, its cached response is evicted so a rerun asks again
+    
+    Returns:
+        Founder profile dictionary or None if parsing fails
+    """
+    # Parse and validate JSON
+    founder_data = parse_founder_json(response)
+    
+    if founder_data is None:
+        logger.warning("Failed to parse founder data for user %s", row.get('_id', 'unknown'))
+        if prompt is not None:
+            get_default_cache().delete(prompt)
+        return None
+    
+    return add_row_fields(founder_data, row)
 
 
 def process_single_founder(
-    row: pd.Series, 
+    row: Dict[str, Any], 
     suggested_role: Optional[str] = None, 
-    suggested_industry: Optional[str] = None
+    suggested_industry: Optional[str] = None,
+    rng: Optional[random.Random] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Process a single Tinder profile row into a founder profile.
     
     Args:
-        row: Pandas Series with Tinder profile data
+        row: Dict with Tinder profile data (see PROCESS_COLUMNS)
         suggested_role: Optional suggested role (soft hint for distribution)
         suggested_industry: Optional suggested industry (soft hint for distribution)
+        rng: Optional random generator for the prompt's example values
     
     Returns:
         Founder profile dictionary or None if processing fails
     """
     try:
-        # Extract input fields
-        bio = row.get('bio', '')
-        job_title = row.get('jobTitle', '')
-        age = row.get('user_age', 0)
-        gender = row.get('gender', '')
-        
-        # Build prompt with suggested soft hints
-        prompt = build_prompt(
-            bio, 
-            job_title, 
-            age, 
-            gender, 
-            suggested_role=suggested_role, 
-            suggested_industry=suggested_industry
-        )
+        prompt = build_row_prompt(row, suggested_role, suggested_industry, rng)
         
         # Call LLM - Now mandatory
         try:
             response = call_llm(prompt)
         except Exception as e:
-            print(f"LLM Call Failed for user {row.get('_id', 'unknown')}: {e}")
+            logger.warning("LLM Call Failed for user %s: %s", row.get('_id', 'unknown'), e)
             return None
         
-        # Parse and validate JSON
-        founder_data = parse_founder_json(response)
-        
-        if founder_data is None:
-            print(f"Failed to parse founder data for user {row.get('_id', 'unknown')}")
-            return None
+        return parse_row_response(response, row, prompt)
         
-        # Add identity fields
-        founder_data['founder_id'] = row.get('_id', '')
-        founder_data['age'] = row.get('user_age', 0)
-        founder_data['gender'] = row.get('gender', '')
+    except Exception as e:
+        logger.warning("Error processing row %s: %s", row.get('_id', 'unknown'), e)
+        return None
+
+
+async def process_single_founder_async(
+    row: Dict[str, Any], 
+    async_client: AsyncOpenAI,
+    suggested_role: Optional[str] = None, 
+    suggested_industry: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+    prompt: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Async variant of process_single_founder using a non-blocking LLM call.
+    
+    Parsing stays synchronous; it is negligible next to the network round-trip.
+    
+    Args:
+        row: Dict with Tinder profile data (see PROCESS_COLUMNS)
+        async_client: Client created on the running event loop
+        suggested_role: Optional suggested role (soft hint for distribution)
+        suggested_industry: Optional suggested industry (soft hint for distribution)
+        rng: Optional random generator for the prompt's example values
+        prompt: Optional prebuilt prompt (e.g. from iter_prompts); when
+            given, the row is not re-rendered and rng is unused
+    
+    Returns:
+        Founder profile dictionary or None if processing fails
+    """
+    try:
+        if prompt is None:
+            prompt = build_row_prompt(row, suggested_role, suggested_industry, rng)
         
-        # Add behavioral scores
-        founder_data['collaboration_openness_score'] = row.get('collaboration_openness_score', 0.5)
-        founder_data['communication_intensity_score'] = row.get('communication_intensity_score', 0.5)
-        founder_data['responsiveness_score'] = row.get('responsiveness_score', 0.5)
+        try:
+            response = await call_llm_async(prompt, async_client)
+        except Exception as e:
+            logger.warning("LLM Call Failed for user %s: %s", row.get('_id', 'unknown'), e)
+            return None
         
-        return founder_data
+        return parse_row_response(response, row, prompt)
         
     except Exception as e:
-        print(f"Error processing row {row.get('_id', 'unknown')}: {e}")
+        logger.warning("Error processing row %s: %s", row.get('_id', 'unknown'), e)
         return None
 
 
-def flatten_founder_profile(founder_data: Dict[str, Any]) -> Dict[str, Any]:
+async def process_founder_batch_async(
+    rows: List[Dict[str, Any]],
+    hints: List[Tuple[Optional[str], Optional[str]]],
+    async_client: AsyncOpenAI,
+    rng: Optional[random.Random] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Generate founder profiles for several rows with a single LLM request.
+    
+    Args:
+        rows: Dicts with Tinder profile data (see PROCESS_COLUMNS)
+        hints: (suggested_role, suggested_industry) per row
+        async_client: Client created on the running event loop
+        rng: Optional random generator for the prompt's example values
+    
+    Returns:
+        List aligned with rows; None marks rows that should be retried individually
+    """
+    try:
+        prompt = build_batch_prompt([row_prompt_inputs(row) for row in rows], hints, rng=rng)
+        if len(prompt) > MAX_BATCH_PROMPT_CHARS:
+            # Too long for one request: fall back to one request per row
+            return [None] * len(rows)
+        
+        response = await call_llm_async(prompt, async_client)
+    except Exception as e:
+        logger.warning("Batch LLM call failed for %d users: %s", len(rows), e)
+        return [None] * len(rows)
+    
+    founders = parse_founder_batch_json(response, len(rows))
+    if all(founder_data is None for founder_data in founders):
+        # Nothing usable: don't replay this response on the next run
+        get_default_cache().delete(prompt)
+    return [
+        add_row_fields(founder_data, row) if founder_data is not None else None
+        for founder_data, row in zip(founders, rows)
+    ]
+
+
+async def _bounded(sema: asyncio.Semaphore, coro: Awaitable[Any]) -> Any:
+    """
+    Await a coroutine while holding a semaphore slot.
+    
+    Args:
+        sema: Semaphore limiting the number of in-flight requests
+        coro: Coroutine to await
+    
+    Returns:
+        The coroutine's result
+    """
+    async with sema:
+        return await coro
+
+
+def flatten_founder_profile(founder_data: Dict[str, Any], serialize_lists: bool = True) -> Dict[str, Any]:
     """
     Flatten nested structures in founder profile for DataFrame conversion.
     
+    The dictionary is modified in-place (no copy is made); callers that still
+    need the nested form must copy it first.
+    
     Args:
         founder_data: Founder profile dictionary
+        serialize_lists: Convert list fields to JSON strings (needed for CSV;
+            Parquet stores lists natively)
     
     Returns:
-        Flattened dictionary suitable for DataFrame row
+        The same dictionary, flattened and suitable for a DataFrame row
     """
-    flattened = founder_data.copy()
+    flattened = founder_data
     
     # Flatten personality traits from nested dict to top-level columns
-    if 'personality_traits' in flattened:
-        traits = flattened.pop('personality_traits')
-        for trait_name in PERSONALITY_TRAITS:
-            flattened[trait_name] = traits.get(trait_name, 3)
+    traits = flattened.pop('personality_traits', {})
+    flattened.update({trait_name: traits.get(trait_name, 3) for trait_name in PERSONALITY_TRAITS})
+    
+    if not serialize_lists:
+        return flattened
     
     # Convert lists to JSON strings for CSV storage
-    list_fields = ['roles', 'secondary_industries', 'tech_stack', 'strengths', 'weaknesses']
-    for field in list_fields:
-        if field in flattened and isinstance(flattened[field], list):
-            flattened[field] = json.dumps(flattened[field])
+    for field in LIST_FIELDS:
+        value = flattened.get(field)
+        if isinstance(value, list):
+            flattened[field] = orjson.dumps(value).decode()
     
     return flattened
 
 
+def _write_group(
+    writer: StreamingDatasetWriter,
+    rows: List[Dict[str, Any]],
+    founder_data: Optional[Dict[str, Any]],
+    serialize_lists: bool
+) -> int:
+    """
+    Write one generated profile for every row of a prompt group.
+    
+    Args:
+        writer: Open output writer
+        rows: Rows sharing the prompt; founder_data already carries the first one's fields
+        founder_data: Parsed founder profile, or None if generation failed
+        serialize_lists: Store list fields as JSON strings (CSV output)
+    
+    Returns:
+        Number of rows that failed (all of them when founder_data is None)
+    """
+    if founder_data is None:
+        return len(rows)
+    
+    # Flatten nested structures, one profile per duplicate row
+    flattened = flatten_founder_profile(founder_data, serialize_lists)
+    writer.write(flattened)
+    for row in rows[1:]:
+        writer.write(add_row_fields(flattened.copy(), row))
+    return 0
+
+
+def _run_batch_api(
+    writer: StreamingDatasetWriter,
+    groups: Dict[Tuple, List[Dict[str, Any]]],
+    keys: List[Tuple],
+    prompt_iter: Iterator[str],
+    serialize_lists: bool
+) -> int:
+    """
+    Generate every group's profile through one OpenAI Batch API job.
+    
+    Args:
+        writer: Open output writer
+        groups: Rows per prompt group key
+        keys: Group keys, aligned with prompt_iter
+        prompt_iter: Single-profile prompts, one per key
+        serialize_lists: Store list fields as JSON strings (CSV output)
+    
+    Returns:
+        Number of rows that failed
+    """
+    prompts = {str(i): prompt for i, prompt in enumerate(prompt_iter)}
+    responses = run_batch_job(prompts)
+    print(f"Batch job returned {len(responses)} of {len(prompts)} responses")
+    
+    failed_rows = 0
+    for i, key in enumerate(keys):
+        response = responses.get(str(i))
+        founder_data = (
+            parse_row_response(response, groups[key][0], prompts[str(i)]) if response is not None else None
+        )
+        failed_rows += _write_group(writer, groups[key], founder_data, serialize_lists)
+    return failed_rows
+
+
+async def _run_single_group(
+    sema: asyncio.Semaphore,
+    async_client: AsyncOpenAI,
+    key: Tuple,
+    row: Dict[str, Any],
+    prompt: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Generate the profile for one prompt group with a single-profile request.
+    
+    Args:
+        sema: Semaphore limiting the number of in-flight requests
+        async_client: Client created on the running event loop
+        key: Group key; its last two entries are the role/industry suggestions
+        row: First row of the group
+        prompt: Prebuilt single-profile prompt for the group
+    
+    Returns:
+        Founder profile dictionary or None if processing fails
+    """
+    suggested_role, suggested_industry = key[-2:]
+    try:
+        return await _bounded(
+            sema, process_single_founder_async(row, async_client, suggested_role, suggested_industry, prompt=prompt)
+        )
+    except Exception as e:
+        logger.warning("Task generated an exception: %s", e)
+        return None
+
+
+async def _run_group_batch(
+    sema: asyncio.Semaphore,
+    async_client: AsyncOpenAI,
+    keys: List[Tuple],
+    prompts: List[str],
+    groups: Dict[Tuple, List[Dict[str, Any]]],
+    group_seed: Dict[Tuple, str]
+) -> List[Tuple[Tuple, Optional[Dict[str, Any]]]]:
+    """
+    Generate profiles for several prompt groups with one multi-profile request.
+    
+    Profiles the batch fails to produce are requeued with one request each.
+    
+    Args:
+        sema: Semaphore limiting the number of in-flight requests
+        async_client: Client created on the running event loop
+        keys: Group keys in the batch
+        prompts: Single-profile prompts aligned with keys, for the retries
+        groups: Rows per prompt group key
+        group_seed: Example-value generator seed per group key
+    
+    Returns:
+        (key, founder profile or None) pairs, in keys order
+    """
+    if len(keys) == 1:
+        return [(
+            keys[0],
+            await _run_single_group(sema, async_client, keys[0], groups[keys[0]][0], prompts[0])
+        )]
+    
+    try:
+        results = await _bounded(
+            sema,
+            process_founder_batch_async(
+                [groups[key][0] for key in keys],
+                [key[-2:] for key in keys],
+                async_client,
+                random.Random(group_seed[keys[0]])
+            )
+        )
+    except Exception as e:
+        logger.warning("Task generated an exception: %s", e)
+        results = [None] * len(keys)
+    
+    # Requeue profiles the batch failed to produce, one request each
+    retry = [i for i, founder_data in enumerate(results) if founder_data is None]
+    retried = await asyncio.gather(*(
+        _run_single_group(sema, async_client, keys[i], groups[keys[i]][0], prompts[i]) for i in retry
+    ))
+    for i, founder_data in zip(retry, retried):
+        results[i] = founder_data
+    
+    return list(zip(keys, results))
+
+
+async def _run_realtime(
+    writer: StreamingDatasetWriter,
+    groups: Dict[Tuple, List[Dict[str, Any]]],
+    keys: List[Tuple],
+    prompt_iter: Iterator[str],
+    group_seed: Dict[Tuple, str],
+    serialize_lists: bool,
+    total_rows: int,
+    max_concurrency: int,
+    batch_size: int
+) -> int:
+    """
+    Generate every group's profile with concurrent real-time requests.
+    
+    At most 2 * max_concurrency batch tasks are scheduled at a time, and
+    prompts are pulled from prompt_iter only as tasks are scheduled, so
+    memory stays flat however many rows there are. Each finished task is
+    dropped once its profiles are written.
+    
+    Args:
+        writer: Open output writer
+        groups: Rows per prompt group key
+        keys: Group keys, aligned with prompt_iter
+        prompt_iter: Single-profile prompts, one per key
+        group_seed: Example-value generator seed per group key
+        serialize_lists: Store list fields as JSON strings (CSV output)
+        total_rows: Number of input rows, for the progress bar
+        max_concurrency: Maximum number of in-flight LLM requests
+        batch_size: Number of profiles generated per LLM request
+    
+    Returns:
+        Number of rows that failed
+    """
+    sema = asyncio.Semaphore(max_concurrency)
+    
+    # One task per batch of unique prompts, holding the batch's prompts;
+    # enough tasks stay scheduled to keep every semaphore slot busy
+    step = max(1, batch_size)
+    max_pending = 2 * max(1, max_concurrency)
+    key_batches = (keys[i:i + step] for i in range(0, len(keys), step))
+    pending: set = set()
+    failed_rows = 0
+    # One client per run: its connection pool is bound to this event loop
+    async with new_async_client() as async_client:
+        with tqdm(total=total_rows, desc="Generating founder profiles", mininterval=1.0) as pbar:
+            while True:
+                # Refill the window; prompts are rendered as they are needed
+                for batch_keys in itertools.islice(key_batches, max_pending - len(pending)):
+                    prompts = list(itertools.islice(prompt_iter, len(batch_keys)))
+                    pending.add(asyncio.create_task(
+                        _run_group_batch(sema, async_client, batch_keys, prompts, groups, group_seed)
+                    ))
+                if not pending:
+                    break
+                
+                # Write results as they complete and drop the finished tasks
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for key, founder_data in task.result():
+                        failed_rows += _write_group(writer, groups[key], founder_data, serialize_lists)
+                        pbar.update(len(groups[key]))
+    return failed_rows
+
+
 def build_founders_dataset(
     csv_path: str = "Tinder_Data_v3_Clean_Edition.csv",
     output_path: str = "founders_dataset.csv",
     max_rows: Optional[int] = None,
-    max_workers: int = 10
+    max_concurrency: int = 50,
+    batch_size: int = 1,
+    use_batch_api: bool = False,
+    seed: int = 0,
+    dedupe_inputs: bool = False
 ) -> pd.DataFrame:
     """
     Build the complete founders dataset from Tinder data.
     
+    Random suggestions and the prompt example values are drawn from NumPy
+    generators spawned from `seed` (multi-profile prompts seed their examples
+    from `seed` and the first row's `_id`), so reruns with the same arguments
+    send identical prompts and are served from the LLM response cache. The
+    draws are prefix-stable: raising `max_rows` keeps the earlier rows'
+    prompts, and only the new rows cost LLM calls. Filtering or reordering
+    the input CSV still changes the prompts after the first changed row.
+    Every row gets its own generated profile unless dedupe_inputs is set.
+    Safe to call from a Jupyter notebook, where an event loop is already
+    running.
+    
     Args:
         csv_path: Path to input Tinder CSV file
-        output_path: Path for output founders CSV file
+        output_path: Path for output founders file (.csv, or .parquet for a
+            smaller, faster-to-load file with native list columns)
         max_rows: Maximum number of rows to process (None for all)
-        max_workers: Number of parallel threads for LLM calls
+        max_concurrency: Maximum number of in-flight LLM requests (replaces the
+            former thread-pool `max_workers` argument)
+        batch_size: Number of profiles generated per LLM request; profiles that
+            fail inside a batch are retried with one request each. Ignored
+            when use_batch_api is set
+        use_batch_api: Submit all prompts as one OpenAI Batch API job (half
+            price, completes within 24h) instead of real-time requests. The
+            job always uses single-profile prompts, since retrying failed
+            profiles from a multi-profile batch would need a second job
+        seed: Base seed for the suggestion and prompt example generators
+        dedupe_inputs: Send rows with identical (bio, job_title, age, gender)
+            to the LLM once, with the first such row's suggestions, and give
+            them all the generated profile. Cheaper on datasets with many blank
+            profiles, at the cost of identical profiles for those rows (752 of
+            the 1209 rows in Tinder_Data_v3_Clean_Edition.csv)
     
     Returns:
-        DataFrame with founder profiles
+        DataFrame with founder profiles, read back from output_path
     """
     print(f"Loading Tinder data from {csv_path}...")
     
     # Load CSV with semicolon separator
     try:
-        df = pd.read_csv(csv_path, sep=";")
+        df = read_csv_fast(csv_path, delimiter=";")
         print(f"Loaded {len(df)} rows")
     except FileNotFoundError:
         print(f"Error: File not found at {csv_path}")
@@ -145,7 +689,7 @@ def build_founders_dataset(
     
     # Compute behavioral scores
     print("Computing behavioral scores...")
-    df = compute_behavioral_scores(df)
+    compute_behavioral_scores_inplace(df)
     print("Behavioral scores computed successfully")
     
     # Limit rows if specified (useful for testing)
@@ -158,77 +702,109 @@ def build_founders_dataset(
     role_weights = [0.35, 0.35, 0.15, 0.15]  # 70% CEO/CTO, 30% others
     
     # Process each row in parallel
-    print(f"Processing {len(df)} profiles with LLM using {max_workers} threads...")
-    founder_profiles = []
+    print(f"Processing {len(df)} profiles with LLM using up to {max_concurrency} concurrent requests...")
     failed_rows = 0
+    serialize_lists = not is_parquet_path(output_path)
     
-    rows_to_process = [row for _, row in df.iterrows()]
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks with weighted random SUGGESTIONS
-        future_to_row = {}
-        for row in rows_to_process:
-            # Weighted random choice for suggested role
-            suggested_role = random.choices(role_options, weights=role_weights, k=1)[0]
-            
-            # Simple random choice for suggested industry
-            suggested_industry = random.choice(ALLOWED_INDUSTRIES)
-            
-            future = executor.submit(process_single_founder, row, suggested_role, suggested_industry)
-            future_to_row[future] = row
-        
-        # Process results as they complete
-        for future in tqdm(concurrent.futures.as_completed(future_to_row), total=len(rows_to_process), desc="Generating founder profiles"):
-            try:
-                founder_data = future.result()
-                if founder_data is not None:
-                    # Flatten nested structures
-                    flattened = flatten_founder_profile(founder_data)
-                    founder_profiles.append(flattened)
-                else:
-                    failed_rows += 1
-            except Exception as e:
-                print(f"Task generated an exception: {e}")
-                failed_rows += 1
-    
-    # Create founders DataFrame
-    print(f"Successfully processed {len(founder_profiles)} founder profiles")
+    # Only the columns the workers read, as plain dicts (no per-row Series)
+    process_columns = [col for col in PROCESS_COLUMNS if col in df.columns]
+    rows_to_process = df[process_columns].to_dict(orient='records')
+    prompt_inputs = prepare_rows(df)
+    
+    # Draw weighted random SUGGESTIONS for all rows up front, one vectorized draw per column.
+    # Each column and the prompt examples get their own stream, so the draws for a
+    # row do not depend on how many rows follow it (e.g. the --max-rows value)
+    role_rng, industry_rng, example_rng = (
+        np.random.default_rng(seed_sequence) for seed_sequence in np.random.SeedSequence(seed).spawn(3)
+    )
+    n_rows = len(rows_to_process)
+    suggested_roles = role_rng.choice(role_options, size=n_rows, p=role_weights).tolist()
+    suggested_industries = industry_rng.choice(ALLOWED_INDUSTRIES, size=n_rows).tolist()
+    
+    # Every row is its own prompt group (keyed by its position), unless
+    # dedupe_inputs merges rows sharing the same (cleaned) prompt inputs.
+    # Keys are inputs + (row index or None, suggested role, suggested industry)
+    groups: Dict[Tuple, List[Dict[str, Any]]] = {}
+    group_seed: Dict[Tuple, str] = {}
+    input_hints: Dict[Tuple, Tuple[str, str]] = {}
+    for index, (row, inputs, suggested_role, suggested_industry) in enumerate(zip(
+        rows_to_process, prompt_inputs, suggested_roles, suggested_industries
+    )):
+        if dedupe_inputs:
+            suggested_role, suggested_industry = input_hints.setdefault(inputs, (suggested_role, suggested_industry))
+            key = inputs + (None, suggested_role, suggested_industry)
+        else:
+            key = inputs + (index, suggested_role, suggested_industry)
+        if key not in groups:
+            groups[key] = []
+            group_seed[key] = f"{seed}:{row.get('_id', '')}"
+        groups[key].append(row)
+    
+    if len(groups) < len(rows_to_process):
+        print(f"Deduplicated {len(rows_to_process)} rows into {len(groups)} unique prompts")
+    
+    # Single-profile prompts are rendered lazily, in vectorized chunks, in key order
+    keys = list(groups)
+    prompt_iter = iter_prompts(
+        [key[:4] for key in keys],
+        [key[-2:] for key in keys],
+        rng=example_rng,
+        chunksize=PROMPT_CHUNK_SIZE,
+        assume_clean=True
+    )
+    
+    # Stream each profile to the output file as soon as it is ready
+    print(f"Writing founders dataset to {output_path} as profiles complete...")
+    with StreamingDatasetWriter(output_path, FOUNDER_COLUMNS, parquet_schema=FOUNDER_PARQUET_SCHEMA) as writer:
+        if use_batch_api:
+            failed_rows += _run_batch_api(writer, groups, keys, prompt_iter, serialize_lists)
+        else:
+            failed_rows += run_sync(_run_realtime(
+                writer, groups, keys, prompt_iter, group_seed, serialize_lists,
+                total_rows=len(rows_to_process), max_concurrency=max_concurrency, batch_size=batch_size
+            ))
+    rows_written = writer.rows_written
+    failed_rows += writer.rows_failed
+    
+    print(f"Successfully processed {rows_written} founder profiles")
     print(f"Failed rows: {failed_rows}")
     
-    if not founder_profiles:
+    if rows_written == 0:
         print("Warning: No founder profiles were successfully generated")
         return pd.DataFrame()
     
-    founders_df = pd.DataFrame(founder_profiles)
-    
-    # Save to CSV
-    print(f"Saving founders dataset to {output_path}...")
-    founders_df.to_csv(output_path, index=False)
-    print(f"Dataset saved successfully with {len(founders_df)} rows")
+    print(f"Dataset saved successfully with {rows_written} rows")
     
-    return founders_df
+    return read_dataset(output_path)
 
 
 def load_founders_dataset(csv_path: str = "founders_dataset.csv") -> pd.DataFrame:
     """
     Load a previously generated founders dataset.
     
-    This helper function deserializes list fields that were stored as JSON strings.
+    This helper function deserializes list fields that were stored as JSON strings
+    in CSV files. Parquet files already store them as lists.
     
     Args:
-        csv_path: Path to founders CSV file
+        csv_path: Path to founders CSV (or .parquet) file
     
     Returns:
         DataFrame with deserialized list fields
     """
-    df = pd.read_csv(csv_path)
+    df = read_dataset(csv_path)
     
     # Deserialize list fields
-    list_fields = ['roles', 'secondary_industries', 'tech_stack', 'strengths', 'weaknesses']
-    
-    for field in list_fields:
+    for field in LIST_FIELDS:
         if field in df.columns:
-            df[field] = df[field].apply(lambda x: json.loads(x) if pd.notna(x) else [])
+            if is_parquet_path(csv_path):
+                # Arrow returns list columns as arrays; convert back to plain lists
+                df[field] = [list(x) if x is not None else [] for x in df[field].values]
+            else:
+                # Decode each distinct JSON string once (list combinations repeat a lot);
+                # copy per row so rows do not share a list object. Empty cells decode to []
+                values = df[field].values
+                decoded = {x: orjson.loads(x) for x in pd.unique(values) if isinstance(x, str) and x}
+                df[field] = [list(decoded[x]) if x in decoded else [] for x in values]
     
     return df
 
@@ -238,6 +814,26 @@ if __name__ == "__main__":
     Main entry point for the pipeline.
     """
     
+    import argparse
+    
+    arg_parser = argparse.ArgumentParser(description="Build the founders dataset from Tinder data.")
+    arg_parser.add_argument("--max-rows", type=int, default=None, help="Process only the first N rows")
+    arg_parser.add_argument(
+        "--dedupe-inputs",
+        action="store_true",
+        help="Send rows with identical bio/job title/age/gender to the LLM once (they share one profile)"
+    )
+    arg_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Submit all prompts as one OpenAI Batch API job (cheaper, completes within 24h); "
+            "uses one profile per request, ignoring LLM_BATCH_SIZE"
+        )
+    )
+    args = arg_parser.parse_args()
+    
+    log_listener = configure_logging()
     try:
         # Check if API is configured (basic check by trying import)
         import openai
@@ -245,8 +841,11 @@ if __name__ == "__main__":
         founders_df = build_founders_dataset(
             csv_path="Tinder_Data_v3_Clean_Edition.csv",
             output_path="founders_dataset.csv",
-            max_rows=None,  # Process all rows
-            max_workers=10  # Parallel threads
+            max_rows=args.max_rows,  # None processes all rows
+            max_concurrency=50,  # In-flight LLM requests
+            batch_size=LLM_BATCH_SIZE,  # Profiles per LLM request
+            use_batch_api=args.batch,
+            dedupe_inputs=args.dedupe_inputs
         )
         
         print("\n" + "="*60)
@@ -271,3 +870,5 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\nUnexpected error: {e}")
         raise
+    finally:
+        log_listener.stop()
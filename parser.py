@@ -2,50 +2,60 @@
 JSON parsing and validation module for founder profiles.
 """
 
-import json
-import re
+import logging
+
+import orjson
 from typing import Optional, Dict, Any, List
 
 from config import (
-    ALLOWED_ROLES,
-    ALLOWED_INDUSTRIES,
-    STRENGTHS_VOCAB,
-    WEAKNESSES_VOCAB,
+    ALLOWED_ROLES_SET,
+    ALLOWED_INDUSTRIES_SET,
+    STRENGTHS_VOCAB_SET,
+    WEAKNESSES_VOCAB_SET,
     DEFAULT_ROLES,
     DEFAULT_INDUSTRY,
     DEFAULT_STRENGTHS,
     DEFAULT_WEAKNESSES,
     PERSONALITY_TRAIT_MIN,
     PERSONALITY_TRAIT_MAX,
-    PERSONALITY_TRAITS
+    PERSONALITY_TRAITS_TUPLE
 )
 
+logger = logging.getLogger(__name__)
+
+_MIN, _MAX = PERSONALITY_TRAIT_MIN, PERSONALITY_TRAIT_MAX
+_TRAITS = PERSONALITY_TRAITS_TUPLE
+
 
 def strip_markdown_fences(text: str) -> str:
     """
     Remove markdown code fences from the response text.
     
+    JSON mode responses almost never carry fences, so this is a couple of
+    prefix/suffix checks rather than a regex search.
+    
     Args:
         text: Raw LLM response text
     
     Returns:
         Cleaned text with fences removed
     """
-    # Remove ```json ... ``` or ``` ... ```
-    text = text.strip()
+    # Fast path: a bare JSON object needs no cleaning
+    if text[:1] == '{':
+        return text
     
-    # Pattern to match code fences
-    patterns = [
-        r'^```json\s*\n?(.*?)\n?```$',
-        r'^```\s*\n?(.*?)\n?```$'
-    ]
+    text = text.strip()
+    if not text.startswith('```'):
+        return text
     
-    for pattern in patterns:
-        match = re.search(pattern, text, re.DOTALL)
-        if match:
-            return match.group(1).strip()
+    # Remove ```json ... ``` or ``` ... ```
+    text = text[3:]
+    if text.startswith('json'):
+        text = text[4:]
+    if text.endswith('```'):
+        text = text[:-3]
     
-    return text
+    return text.strip()
 
 
 def validate_and_fix_roles(data: Dict[str, Any]) -> None:
@@ -61,7 +71,7 @@ def validate_and_fix_roles(data: Dict[str, Any]) -> None:
         roles = [roles] if roles else []
     
     # Filter to allowed roles
-    roles = [r for r in roles if r in ALLOWED_ROLES]
+    roles = [r for r in roles if isinstance(r, str) and r in ALLOWED_ROLES_SET]
     
     # Default if empty
     if not roles:
@@ -87,7 +97,7 @@ def validate_and_fix_industry(data: Dict[str, Any]) -> None:
     """
     # Validate primary industry
     industry = data.get('industry', '')
-    if industry not in ALLOWED_INDUSTRIES:
+    if not (isinstance(industry, str) and industry in ALLOWED_INDUSTRIES_SET):
         industry = DEFAULT_INDUSTRY
     
     data['industry'] = industry
@@ -98,7 +108,7 @@ def validate_and_fix_industry(data: Dict[str, Any]) -> None:
         secondary = [secondary] if secondary else []
     
     # Filter to allowed, limit to 2
-    secondary = [s for s in secondary if s in ALLOWED_INDUSTRIES][:2]
+    secondary = [s for s in secondary if isinstance(s, str) and s in ALLOWED_INDUSTRIES_SET][:2]
     
     data['secondary_industries'] = secondary
 
@@ -116,14 +126,12 @@ def validate_and_fix_strengths_weaknesses(data: Dict[str, Any]) -> None:
         strengths = [strengths] if strengths else []
     
     # Filter to vocab
-    strengths = [s for s in strengths if s in STRENGTHS_VOCAB]
+    strengths = [s for s in strengths if isinstance(s, str) and s in STRENGTHS_VOCAB_SET]
     
     # Pad with defaults if needed
-    while len(strengths) < 3:
-        for default in DEFAULT_STRENGTHS:
-            if default not in strengths:
-                strengths.append(default)
-                break
+    if len(strengths) < 3:
+        present = set(strengths)
+        strengths.extend(d for d in DEFAULT_STRENGTHS if d not in present)
     
     # Limit to 3
     data['strengths'] = strengths[:3]
@@ -134,23 +142,40 @@ def validate_and_fix_strengths_weaknesses(data: Dict[str, Any]) -> None:
         weaknesses = [weaknesses] if weaknesses else []
     
     # Filter to vocab
-    weaknesses = [w for w in weaknesses if w in WEAKNESSES_VOCAB]
+    weaknesses = [w for w in weaknesses if isinstance(w, str) and w in WEAKNESSES_VOCAB_SET]
     
     # Pad with defaults if needed
-    while len(weaknesses) < 2:
-        for default in DEFAULT_WEAKNESSES:
-            if default not in weaknesses:
-                weaknesses.append(default)
-                break
+    if len(weaknesses) < 2:
+        present = set(weaknesses)
+        weaknesses.extend(d for d in DEFAULT_WEAKNESSES if d not in present)
     
     # Limit to 2
     data['weaknesses'] = weaknesses[:2]
 
 
+def _coerce_trait(value: Any) -> int:
+    """
+    Convert a trait value to an int clipped to the allowed range.
+    
+    Args:
+        value: Raw trait value from the LLM
+    
+    Returns:
+        Integer in [PERSONALITY_TRAIT_MIN, PERSONALITY_TRAIT_MAX], or 3 if not numeric
+    """
+    try:
+        value = int(value)
+    except (ValueError, TypeError):
+        return 3
+    return _MIN if value < _MIN else _MAX if value > _MAX else value
+
+
 def validate_and_fix_personality_traits(data: Dict[str, Any]) -> None:
     """
     Validate and fix personality traits in-place.
     
+    Only the known traits are kept; missing ones default to the middle value.
+    
     Args:
         data: Parsed JSON data
     """
@@ -159,20 +184,7 @@ def validate_and_fix_personality_traits(data: Dict[str, Any]) -> None:
     if not isinstance(traits, dict):
         traits = {}
     
-    # Ensure all required traits exist and are in valid range
-    for trait_name in PERSONALITY_TRAITS:
-        value = traits.get(trait_name, 3)  # Default to middle value
-        
-        # Try to convert to int and clip
-        try:
-            value = int(value)
-        except (ValueError, TypeError):
-            value = 3
-        
-        value = max(PERSONALITY_TRAIT_MIN, min(PERSONALITY_TRAIT_MAX, value))
-        traits[trait_name] = value
-    
-    data['personality_traits'] = traits
+    data['personality_traits'] = {trait_name: _coerce_trait(traits.get(trait_name, 3)) for trait_name in _TRAITS}
 
 
 def validate_basic_fields(data: Dict[str, Any]) -> None:
@@ -207,6 +219,30 @@ def validate_basic_fields(data: Dict[str, Any]) -> None:
     data['problem_space'] = data.get('problem_space', 'No problem space defined.')
 
 
+def validate_founder_data(data: Any) -> Optional[Dict[str, Any]]:
+    """
+    Validate and fix an already-decoded founder profile in-place.
+    
+    Args:
+        data: Decoded JSON value for one founder
+    
+    Returns:
+        Validated founder profile dictionary, or None if data is not an object
+    """
+    if not isinstance(data, dict):
+        logger.warning("Founder JSON is not an object: %s", type(data).__name__)
+        return None
+    
+    # Validate and fix all fields
+    validate_and_fix_roles(data)
+    validate_and_fix_industry(data)
+    validate_and_fix_strengths_weaknesses(data)
+    validate_and_fix_personality_traits(data)
+    validate_basic_fields(data)
+    
+    return data
+
+
 def parse_founder_json(response_text: str) -> Optional[Dict[str, Any]]:
     """
     Parse and validate founder profile JSON from LLM response.
@@ -222,21 +258,55 @@ def parse_founder_json(response_text: str) -> Optional[Dict[str, Any]]:
         cleaned_text = strip_markdown_fences(response_text)
         
         # Parse JSON
-        data = json.loads(cleaned_text)
+        data = orjson.loads(cleaned_text)
         
-        # Validate and fix all fields
-        validate_and_fix_roles(data)
-        validate_and_fix_industry(data)
-        validate_and_fix_strengths_weaknesses(data)
-        validate_and_fix_personality_traits(data)
-        validate_basic_fields(data)
+        return validate_founder_data(data)
         
-        return data
-        
-    except json.JSONDecodeError as e:
-        print(f"JSON decode error: {e}")
+    except orjson.JSONDecodeError as e:
+        logger.warning("JSON decode error: %s", e)
         return None
     except Exception as e:
-        print(f"Unexpected error parsing founder JSON: {e}")
+        logger.warning("Unexpected error parsing founder JSON: %s", e)
         return None
 
+
+def parse_founder_batch_json(response_text: str, expected_count: int) -> List[Optional[Dict[str, Any]]]:
+    """
+    Parse and validate a batched {"founders": [...]} LLM response.
+    
+    Founders are matched to inputs by their 1-based "input_index" when present
+    and valid, otherwise by position. Inputs without a valid founder get None
+    so the caller can retry them individually.
+    
+    Args:
+        response_text: Raw text response from LLM
+        expected_count: Number of input profiles in the batch
+    
+    Returns:
+        List of length expected_count with validated profiles or None
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * expected_count
+    
+    try:
+        data = orjson.loads(strip_markdown_fences(response_text))
+    except orjson.JSONDecodeError as e:
+        logger.warning("JSON decode error in batch response: %s", e)
+        return results
+    
+    founders = data.get('founders') if isinstance(data, dict) else None
+    if not isinstance(founders, list):
+        logger.warning("Batch response has no 'founders' list")
+        return results
+    
+    for position, item in enumerate(founders):
+        index = item.pop('input_index', None) if isinstance(item, dict) else None
+        slot = index - 1 if isinstance(index, int) and 1 <= index <= expected_count else position
+        if slot >= expected_count or results[slot] is not None:
+            continue
+        
+        try:
+            results[slot] = validate_founder_data(item)
+        except Exception as e:
+            logger.warning("Unexpected error validating batched founder %d: %s", slot + 1, e)
+    
+    return results
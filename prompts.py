@@ -2,95 +2,318 @@
 Prompt building module for LLM-based founder profile generation.
 """
 
+import functools
+import json
 import random
-from typing import Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from config import (
     ALLOWED_ROLES,
     ALLOWED_INDUSTRIES,
     STRENGTHS_VOCAB,
     WEAKNESSES_VOCAB,
-    PERSONALITY_TRAITS
+    PERSONALITY_TRAITS,
+    PROMPT_CHUNK_SIZE
 )
 
-def build_prompt(
-    bio: str, 
-    job_title: str, 
-    age: int, 
-    gender: str,
-    suggested_role: Optional[str] = None,
-    suggested_industry: Optional[str] = None
-) -> str:
+# Serialized vocabularies and example value pools, computed once at import
+_STRENGTHS_JSON = json.dumps(STRENGTHS_VOCAB)
+_WEAKNESSES_JSON = json.dumps(WEAKNESSES_VOCAB)
+_EDUCATION_LEVELS = ("bachelor", "master", "phd", "bootcamp", "self-taught")
+_TECH_OPTIONS = (
+    "Python", "Django", "React", "Node.js", "AWS", "Firebase",
+    "Figma", "Notion", "Webflow", "Bubble", "Excel", "Tableau",
+    "PostgreSQL", "MongoDB", "Docker", "Kubernetes", "Swift"
+)
+
+# Vocabularies as tuples: fixed, hashable and fast to index
+_ROLES = tuple(ALLOWED_ROLES)
+_INDUSTRIES = tuple(ALLOWED_INDUSTRIES)
+_STRENGTHS = tuple(STRENGTHS_VOCAB)
+_WEAKNESSES = tuple(WEAKNESSES_VOCAB)
+_TRAITS = tuple(PERSONALITY_TRAITS)
+_ROLE_INDEX = {role: i for i, role in enumerate(_ROLES)}
+# Pool of alternative roles for each preferred role, so it is not rebuilt per call
+_OTHER_ROLES = {role: tuple(r for r in _ROLES if r != role) for role in _ROLES}
+
+# Lowercased field values treated as missing
+NULL_TOKENS = frozenset({"nan", "none"})
+JOB_TITLE_NULL_TOKENS = NULL_TOKENS | {"unknown"}
+
+# (placeholder, null tokens) for each of (bio, job_title, age, gender)
+PROFILE_FIELD_DEFAULTS = (
+    ("No bio provided", NULL_TOKENS),
+    ("Not specified", JOB_TITLE_NULL_TOKENS),
+    ("Unknown", NULL_TOKENS),
+    ("Not specified", NULL_TOKENS),
+)
+
+# Invariant instructions and vocabularies, emitted first in every prompt.
+# Built once at import, so per-row rendering only formats the variable part.
+# It is too short for OpenAI prompt caching (at least 1024 identical leading
+# tokens are needed; this is roughly 550-780), so it saves no API cost.
+STATIC_PREFIX = f"""You are transforming dating app user profiles into tech startup founder profiles.
+
+CRITICAL VOCABULARY RULES:
+
+1. Strengths must be selected ONLY from this list:
+   {_STRENGTHS_JSON}
+
+2. Weaknesses must be selected ONLY from this list:
+   {_WEAKNESSES_JSON}
+
+3. The startup idea MUST be directly and logically linked to the selected "industry".
+   - If industry = Fintech → idea must involve payments, credit, compliance, banking, etc.
+   - If industry = Healthtech → idea must involve health, diagnostics, care delivery, etc.
+   - If industry = AI / Deeptech → idea must involve ML, AI agents, infrastructure, etc.
+   - If industry = Marketplaces → idea must involve a two-sided market.
+   - NO cross-domain or unrelated ideas.
+
+GENERAL RULES:
+- Use ONLY the allowed values for roles and industry.
+- Output VALID JSON only (no markdown, no explanation).
+- Use the dating bio and job title to infer background and personality.
+
+FIELD NOTES (for the JSON structure below):
+- roles: non-empty subset of {json.dumps(ALLOWED_ROLES)}, including preferred_role
+- preferred_role: exactly one of the allowed roles
+- industry: exactly one of {json.dumps(ALLOWED_INDUSTRIES)}
+- secondary_industries: optional, 0-2 values from the allowed industries
+- is_technical: true or false, based on bio/job/role
+- education_level: e.g. "bachelor", "master", "phd", "bootcamp", "self-taught"
+- tech_stack: list of tools/languages relevant to the role/idea
+- strengths: 3 values relevant to the persona; weaknesses: 2 values relevant to the persona
+- personality_traits: integers from 1 to 5
+
+"""
+_PREFIX_BYTES = STATIC_PREFIX.encode("utf-8")
+
+
+_thread_state = threading.local()
+
+
+def _thread_rng() -> random.Random:
     """
-    Build a prompt for the LLM to generate a founder profile from dating app data.
+    Return this thread's default example generator, creating it on first use.
+    
+    Threads building prompts concurrently each get their own unseeded state
+    instead of sharing the module-level `random` generator.
+    
+    Returns:
+        Per-thread random.Random instance
+    """
+    rng = getattr(_thread_state, "rng", None)
+    if rng is None:
+        rng = _thread_state.rng = random.Random()
+    return rng
+
+
+def _clean(value: Any, default: str, banned: frozenset = NULL_TOKENS) -> Any:
+    """
+    Return value, or default if it is empty, blank or a null token like 'nan'.
+    
+    Args:
+        value: Raw profile field
+        default: Placeholder for missing values
+        banned: Lowercased tokens treated as missing
+    
+    Returns:
+        The original value or the default
+    """
+    if not value:
+        return default
+    text = str(value).strip()
+    return default if not text or text.lower() in banned else value
+
+
+def _clean_profile_inputs(bio: str, job_title: str, age: int, gender: str) -> Tuple[str, str, Any, str]:
+    """
+    Replace missing or null profile fields with readable placeholders.
     
     Args:
         bio: User's bio text (can be empty/None)
         job_title: User's job title (can be "unknown" or None)
         age: User's age
         gender: User's gender
+    
+    Returns:
+        Tuple of (bio, job_title, age, gender) safe to put in a prompt
+    """
+    return tuple(
+        _clean(value, default, banned)
+        for value, (default, banned) in zip((bio, job_title, age, gender), PROFILE_FIELD_DEFAULTS)
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_hints(suggested_role: Optional[str], suggested_industry: Optional[str]) -> str:
+    """
+    Construct the soft hint instructions for role and industry.
+    
+    Cached: there are only a few dozen (role, industry) combinations.
+    
+    Args:
         suggested_role: Optionally suggest a preferred_role (soft hint)
         suggested_industry: Optionally suggest an industry (soft hint)
     
     Returns:
-        Formatted prompt string for LLM
+        Hint lines, each starting with a newline
     """
-    # Handle missing or null values
-    bio = bio if bio and str(bio).strip() and str(bio).lower() != 'nan' else "No bio provided"
-    job_title = job_title if job_title and str(job_title).strip() and str(job_title).lower() not in ['nan', 'unknown'] else "Not specified"
-    age = age if age and str(age).lower() != 'nan' else "Unknown"
-    gender = gender if gender and str(gender).strip() and str(gender).lower() != 'nan' else "Not specified"
+    hints = ""
+    if suggested_role:
+        hints += f"\n- **Role Preference:** Ideally, assign '{suggested_role}' to balance our dataset. HOWEVER, if the bio/job strongly suggests otherwise (e.g. 'Senior Engineer' -> CTO), prioritize the realistic fit over this suggestion."
+    else:
+        hints += f"\n- Role: Pick most suitable from {ALLOWED_ROLES} based on profile."
+
+    if suggested_industry:
+        hints += f"\n- **Industry Preference:** Ideally, assign '{suggested_industry}'. Override only if the profile is explicitly incompatible (e.g. bio mentions 'fashion' but suggestion is 'Fintech')."
+    else:
+        hints += f"\n- Industry: Pick most suitable from allowed industries."
+
+    return hints
+
+
+def _render_example_json(
+    ex_role: str,
+    ex_roles_list: Sequence[str],
+    ex_industry: str,
+    ex_years: int,
+    ex_is_technical: bool,
+    ex_education: str,
+    ex_tech_stack: Sequence[str],
+    ex_strengths: Sequence[str],
+    ex_weaknesses: Sequence[str],
+    ex_traits: Sequence[int]
+) -> str:
+    """
+    Render the annotated example JSON from already drawn example values.
     
+    Args:
+        ex_role: Example preferred_role
+        ex_roles_list: Example roles list (includes ex_role)
+        ex_industry: Example industry
+        ex_years: Example years of experience
+        ex_is_technical: Example is_technical flag
+        ex_education: Example education level
+        ex_tech_stack: Example tech stack
+        ex_strengths: Example strengths (3)
+        ex_weaknesses: Example weaknesses (2)
+        ex_traits: Example personality trait values, in PERSONALITY_TRAITS order
+    
+    Returns:
+        Example JSON block describing the required structure
+    """
+    # Example Idea (Generic placeholders based on industry to be safe)
+    ex_idea_title = f"{ex_industry} Innovation Project"
+    
+    risk_tolerance, leadership, autonomy, vision, communication, execution_speed = ex_traits
+    
+    return f"""{{
+  "roles": {json.dumps(ex_roles_list)},
+  "preferred_role": "{ex_role}",
+  "industry": "{ex_industry}",
+  "secondary_industries": ["Fintech"],
+  "years_of_experience": {ex_years},
+  "is_technical": {json.dumps(ex_is_technical)},
+  "education_level": "{ex_education}",
+  "tech_stack": {json.dumps(ex_tech_stack)},
+  "strengths": {json.dumps(ex_strengths)},
+  "weaknesses": {json.dumps(ex_weaknesses)},
+  "personality_traits": {{
+    "risk_tolerance": {risk_tolerance},
+    "leadership": {leadership},
+    "autonomy": {autonomy},
+    "vision": {vision},
+    "communication": {communication},
+    "execution_speed": {execution_speed}
+  }},
+  "idea_title": "{ex_idea_title}",
+  "idea_description": "3 to 6 sentences describing a unique startup idea related to the chosen industry.",
+  "problem_space": "One or two sentences summarizing the problem being solved."
+}}"""
+
+
+def _build_example_json(
+    rng,
+    suggested_role: Optional[str] = None,
+    suggested_industry: Optional[str] = None
+) -> str:
+    """
+    Render the annotated example JSON with randomized values.
+    
+    Args:
+        rng: Random generator for the example values
+        suggested_role: Optional role to use in the example
+        suggested_industry: Optional industry to use in the example
+    
+    Returns:
+        Example JSON block describing the required structure
+    """
     # --- Randomize example values to prevent overfitting ---
     
     # Role & Industry (use suggested values for EXAMPLES if provided, but LLM can override)
-    ex_role = suggested_role if suggested_role else random.choice(ALLOWED_ROLES)
-    ex_industry = suggested_industry if suggested_industry else random.choice(ALLOWED_INDUSTRIES)
+    ex_role = suggested_role if suggested_role else rng.choice(_ROLES)
+    ex_industry = suggested_industry if suggested_industry else rng.choice(_INDUSTRIES)
     
     # Ensure role list has the preferred role plus maybe another one
-    other_role = random.choice([r for r in ALLOWED_ROLES if r != ex_role])
-    ex_roles_list = list(set([ex_role, other_role]))
+    other_roles = _OTHER_ROLES.get(ex_role) or [r for r in _ROLES if r != ex_role]
+    other_role = rng.choice(other_roles)
+    ex_roles_list = [ex_role, other_role]  # distinct by construction, preferred role first
     
     # Experience & Technical
-    ex_years = random.randint(2, 12)
-    ex_is_technical = random.choice([True, False])
+    ex_years = rng.randint(2, 12)
+    ex_is_technical = rng.choice([True, False])
     
     # Education
-    education_levels = ["bachelor", "master", "phd", "bootcamp", "self-taught"]
-    ex_education = random.choice(education_levels)
+    ex_education = rng.choice(_EDUCATION_LEVELS)
     
     # Tech Stack (just a few random examples)
-    tech_options = [
-        "Python", "Django", "React", "Node.js", "AWS", "Firebase", 
-        "Figma", "Notion", "Webflow", "Bubble", "Excel", "Tableau", 
-        "PostgreSQL", "MongoDB", "Docker", "Kubernetes", "Swift"
-    ]
-    ex_tech_stack = random.sample(tech_options, k=random.randint(2, 4))
+    ex_tech_stack = rng.sample(_TECH_OPTIONS, k=rng.randint(2, 4))
     
     # Strengths & Weaknesses
-    ex_strengths = random.sample(STRENGTHS_VOCAB, k=3)
-    ex_weaknesses = random.sample(WEAKNESSES_VOCAB, k=2)
+    ex_strengths = rng.sample(_STRENGTHS, k=3)
+    ex_weaknesses = rng.sample(_WEAKNESSES, k=2)
     
     # Personality Traits
-    ex_traits = {trait: random.randint(2, 5) for trait in PERSONALITY_TRAITS}
-    
-    # Example Idea (Generic placeholders based on industry to be safe)
-    ex_idea_title = f"{ex_industry} Innovation Project"
+    ex_traits = tuple(rng.randint(2, 5) for _ in _TRAITS)
     
-    # Construct soft hint instructions
-    hints = ""
-    if suggested_role:
-        hints += f"\n- **Role Preference:** Ideally, assign '{suggested_role}' to balance our dataset. HOWEVER, if the bio/job strongly suggests otherwise (e.g. 'Senior Engineer' -> CTO), prioritize the realistic fit over this suggestion."
-    else:
-        hints += f"\n- Role: Pick most suitable from {ALLOWED_ROLES} based on profile."
-
-    if suggested_industry:
-        hints += f"\n- **Industry Preference:** Ideally, assign '{suggested_industry}'. Override only if the profile is explicitly incompatible (e.g. bio mentions 'fashion' but suggestion is 'Fintech')."
-    else:
-        hints += f"\n- Industry: Pick most suitable from allowed industries."
+    return _render_example_json(
+        ex_role, ex_roles_list, ex_industry, ex_years, ex_is_technical,
+        ex_education, ex_tech_stack, ex_strengths, ex_weaknesses, ex_traits
+    )
 
-    prompt = f"""You are transforming a dating app user profile into a tech startup founder profile.
 
-INPUT PROFILE:
+def _render_prompt(
+    bio: str,
+    job_title: str,
+    age: Any,
+    gender: str,
+    hints: str,
+    example_json: str,
+    prefix: str = STATIC_PREFIX
+) -> str:
+    """
+    Assemble a single-profile prompt from cleaned inputs and rendered parts.
+    
+    Args:
+        bio: Cleaned bio text
+        job_title: Cleaned job title
+        age: Cleaned age
+        gender: Cleaned gender
+        hints: Hint lines from _build_hints
+        example_json: Example block from _render_example_json
+        prefix: Leading static text ("" renders only the per-row part)
+    
+    Returns:
+        Formatted prompt string for LLM
+    """
+    # An f-string compiles to one BUILD_STRING over constant literals; a
+    # string.Template / str.format_map version measured ~8x slower here
+    return f"""{prefix}INPUT PROFILE:
 - Bio: {bio}
 - Job title: {job_title}
 - Age: {age}
@@ -104,56 +327,352 @@ GUIDANCE & PREFERENCES:{hints}
 
 REQUIRED JSON STRUCTURE:
 
-{{
-  "roles": {str(ex_roles_list).replace("'", '"')},    // non-empty subset of: ["CEO","CTO","CPO","COO"] including preferred_role
-  "preferred_role": "{ex_role}",       // exactly one of allowed roles
+{example_json}"""
 
-  "industry": "{ex_industry}",         // exactly one of allowed industries
 
-  "secondary_industries": ["Fintech"], // optional, 0–2 values from allowed list
+def _render_single_prompt(
+    bio: str,
+    job_title: str,
+    age: Any,
+    gender: str,
+    suggested_role: Optional[str],
+    suggested_industry: Optional[str],
+    rng: Optional[random.Random],
+    assume_clean: bool,
+    prefix: str
+) -> str:
+    """
+    Shared body of build_prompt and build_prompt_bytes.
+    
+    Args:
+        bio: User's bio text
+        job_title: User's job title
+        age: User's age
+        gender: User's gender
+        suggested_role: Optional suggested preferred_role
+        suggested_industry: Optional suggested industry
+        rng: Optional random generator for the example values
+        assume_clean: Skip the missing-value cleaning
+        prefix: Leading static text passed to _render_prompt
+    
+    Returns:
+        Formatted prompt string (or its per-row part, for prefix="")
+    """
+    # Handle missing or null values
+    if not assume_clean:
+        bio, job_title, age, gender = _clean_profile_inputs(bio, job_title, age, gender)
+    
+    if rng is None:
+        rng = _thread_rng()
+    example_json = _build_example_json(rng, suggested_role, suggested_industry)
+    
+    hints = _build_hints(suggested_role, suggested_industry)
+    
+    return _render_prompt(bio, job_title, age, gender, hints, example_json, prefix=prefix)
 
-  "years_of_experience": {ex_years},
-  "is_technical": {str(ex_is_technical).lower()},               // true or false based on bio/job/role
-  "education_level": "{ex_education}",       // e.g. "bachelor", "master", "phd", "bootcamp", "self-taught"
 
-  "tech_stack": {str(ex_tech_stack).replace("'", '"')},   // LIST of tools/languages relevant to their role/idea
+def build_prompt(
+    bio: str, 
+    job_title: str, 
+    age: int, 
+    gender: str,
+    suggested_role: Optional[str] = None,
+    suggested_industry: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+    assume_clean: bool = False
+) -> str:
+    """
+    Build a prompt for the LLM to generate a founder profile from dating app data.
+    
+    Args:
+        bio: User's bio text (can be empty/None)
+        job_title: User's job title (can be "unknown" or None)
+        age: User's age
+        gender: User's gender
+        suggested_role: Optionally suggest a preferred_role (soft hint)
+        suggested_industry: Optionally suggest an industry (soft hint)
+        rng: Optional random generator for the example values (defaults to an
+            unseeded per-thread generator); a seeded instance makes the prompt reproducible
+        assume_clean: Skip the missing-value cleaning when the inputs are
+            already cleaned (e.g. column-wise by the caller)
+    
+    Returns:
+        Formatted prompt string for LLM
+    """
+    return _render_single_prompt(
+        bio, job_title, age, gender, suggested_role, suggested_industry, rng, assume_clean, STATIC_PREFIX
+    )
 
-  "strengths": {str(ex_strengths).replace("'", '"')},     // Select 3 relevant to the PERSONA
-  "weaknesses": {str(ex_weaknesses).replace("'", '"')},   // Select 2 relevant to the PERSONA
 
-  "personality_traits": {{
-    "risk_tolerance": {ex_traits['risk_tolerance']},               // 1-5 integer
-    "leadership": {ex_traits['leadership']},                   // 1-5 integer
-    "autonomy": {ex_traits['autonomy']},                     // 1-5 integer
-    "vision": {ex_traits['vision']},                       // 1-5 integer
-    "communication": {ex_traits['communication']},                // 1-5 integer
-    "execution_speed": {ex_traits['execution_speed']}               // 1-5 integer
-  }},
+def build_prompt_bytes(
+    bio: str, 
+    job_title: str, 
+    age: int, 
+    gender: str,
+    suggested_role: Optional[str] = None,
+    suggested_industry: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+    assume_clean: bool = False
+) -> bytes:
+    """
+    Build the same prompt as build_prompt, UTF-8 encoded.
+    
+    The static prefix is encoded once at import, so only the per-row part
+    is encoded per call. For consumers that send raw bytes (e.g. an HTTP
+    body or a tokenizer); the OpenAI SDK takes str prompts.
+    
+    Args:
+        bio: User's bio text (can be empty/None)
+        job_title: User's job title (can be "unknown" or None)
+        age: User's age
+        gender: User's gender
+        suggested_role: Optionally suggest a preferred_role (soft hint)
+        suggested_industry: Optionally suggest an industry (soft hint)
+        rng: Optional random generator for the example values
+        assume_clean: Skip the missing-value cleaning when the inputs are
+            already cleaned (e.g. column-wise by the caller)
+    
+    Returns:
+        UTF-8 encoded prompt
+    """
+    suffix = _render_single_prompt(
+        bio, job_title, age, gender, suggested_role, suggested_industry, rng, assume_clean, ""
+    )
+    return _PREFIX_BYTES + suffix.encode("utf-8")
 
-  "idea_title": "{ex_idea_title}",
-  "idea_description": "3 to 6 sentences describing a unique startup idea related to the chosen industry.",
-  "problem_space": "One or two sentences summarizing the problem being solved."
-}}
 
-CRITICAL VOCABULARY RULES:
+def build_batch_prompt(
+    rows: Sequence[Tuple[str, str, int, str]],
+    hints: Sequence[Tuple[Optional[str], Optional[str]]],
+    rng: Optional[random.Random] = None,
+    assume_clean: bool = False
+) -> str:
+    """
+    Build a single prompt asking the LLM for one founder profile per input row.
+    
+    The prompt starts with the same STATIC_PREFIX as build_prompt; the JSON
+    structure is emitted once and the inputs are enumerated 1..K, so the fixed
+    part of the prompt is paid for once per batch.
+    The response is expected as {"founders": [...]} with one object per input,
+    each carrying its "input_index".
+    
+    Args:
+        rows: Sequence of (bio, job_title, age, gender) tuples
+        hints: Sequence of (suggested_role, suggested_industry) tuples, aligned with rows
+        rng: Optional random generator for the example values
+        assume_clean: Skip the missing-value cleaning when the inputs are
+            already cleaned (e.g. column-wise by the caller)
+    
+    Returns:
+        Formatted batch prompt string for LLM
+    """
+    if rng is None:
+        rng = _thread_rng()
+    example_json = _build_example_json(rng)
+    
+    profiles = []
+    for i, (row, (suggested_role, suggested_industry)) in enumerate(zip(rows, hints), start=1):
+        bio, job_title, age, gender = row if assume_clean else _clean_profile_inputs(*row)
+        profile_hints = _build_hints(suggested_role, suggested_industry).replace("\n- ", "\n   - ")
+        profiles.append(f"""{i}.
+- Bio: {bio}
+- Job title: {job_title}
+- Age: {age}
+- Gender: {gender}
+- Guidance & preferences:{profile_hints}""")
+    
+    profiles_text = "\n\n".join(profiles)
+    
+    prompt = f"""{STATIC_PREFIX}INPUT PROFILES ({len(profiles)}):
 
-1. Strengths must be selected ONLY from this list:
-   {str(STRENGTHS_VOCAB).replace("'", '"')}
+{profiles_text}
 
-2. Weaknesses must be selected ONLY from this list:
-   {str(WEAKNESSES_VOCAB).replace("'", '"')}
+TASK:
+Generate one realistic structured JSON founder profile for EACH input profile, independently of the others.
+If an input bio/job is generic, hallucinate a creative and plausible persona (e.g., a former lawyer building legal tech, a chef building food tech, etc.).
+Follow each profile's guidance & preferences.
 
-3. The startup idea MUST be directly and logically linked to the selected "industry".
-   - If industry = Fintech → idea must involve payments, credit, compliance, banking, etc.
-   - If industry = Healthtech → idea must involve health, diagnostics, care delivery, etc.
-   - If industry = AI / Deeptech → idea must involve ML, AI agents, infrastructure, etc.
-   - If industry = Marketplaces → idea must involve a two-sided market.
-   - NO cross-domain or unrelated ideas.
+REQUIRED JSON STRUCTURE:
 
-GENERAL RULES:
-- Use ONLY the allowed values for roles and industry.
-- Output VALID JSON only (no markdown, no explanation).
-- Use the dating bio and job title to infer background and personality.
-"""
+Return a JSON object of the form {{"founders": [...]}} containing exactly {len(profiles)} founder objects, one per input profile.
+Each founder object MUST include "input_index" (the number of its input profile) plus the fields below:
+
+{example_json}"""
     
     return prompt
+
+
+def build_prompts_batch(
+    rows: Sequence[Tuple[str, str, int, str]],
+    hints: Optional[Sequence[Tuple[Optional[str], Optional[str]]]] = None,
+    rng: Optional[np.random.Generator] = None,
+    assume_clean: bool = False,
+    draw_rows: Optional[int] = None
+) -> List[str]:
+    """
+    Build single-profile prompts for many rows, drawing all example values up front.
+    
+    Produces the same prompt structure as build_prompt, but the randomized
+    example values for all N rows come from a handful of vectorized NumPy
+    draws instead of ~15 stdlib `random` calls per row.
+    
+    Args:
+        rows: Sequence of (bio, job_title, age, gender) tuples
+        hints: Optional (suggested_role, suggested_industry) per row
+        rng: Optional NumPy generator (defaults to a fresh unseeded one); a
+            seeded generator makes the prompts reproducible
+        assume_clean: Skip the missing-value cleaning when the inputs are
+            already cleaned (e.g. column-wise by the caller)
+        draw_rows: Optional number of rows to draw example values for (at
+            least len(rows); the extra draws are discarded), so the generator
+            advances by the same amount however many rows are passed
+    
+    Returns:
+        List of prompt strings, aligned with rows
+    """
+    if len(rows) == 0:
+        return []
+    n = max(len(rows), draw_rows or 0)
+    if hints is None:
+        hints = [(None, None)] * n
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    n_roles = len(_ROLES)
+    role_idx = rng.integers(n_roles, size=n).tolist()
+    # A non-zero offset from the preferred role always picks a different one
+    other_offset = rng.integers(1, n_roles, size=n).tolist()
+    industry_idx = rng.integers(len(_INDUSTRIES), size=n).tolist()
+    years = rng.integers(2, 13, size=n).tolist()
+    is_technical = rng.integers(0, 2, size=n).astype(bool).tolist()
+    education_idx = rng.integers(len(_EDUCATION_LEVELS), size=n).tolist()
+    tech_k = rng.integers(2, 5, size=n).tolist()
+    # Row-wise random permutations: sampling without replacement for every row at once
+    tech_idx = rng.random((n, len(_TECH_OPTIONS))).argsort(axis=1)[:, :4].tolist()
+    strengths_idx = rng.random((n, len(_STRENGTHS))).argsort(axis=1)[:, :3].tolist()
+    weaknesses_idx = rng.random((n, len(_WEAKNESSES))).argsort(axis=1)[:, :2].tolist()
+    traits = rng.integers(2, 6, size=(n, len(_TRAITS))).tolist()
+    
+    prompts = []
+    for i, (row, (suggested_role, suggested_industry)) in enumerate(zip(rows, hints)):
+        bio, job_title, age, gender = row if assume_clean else _clean_profile_inputs(*row)
+        
+        ex_role = suggested_role if suggested_role else _ROLES[role_idx[i]]
+        ex_industry = suggested_industry if suggested_industry else _INDUSTRIES[industry_idx[i]]
+        base = _ROLE_INDEX.get(ex_role, role_idx[i])
+        other_role = _ROLES[(base + other_offset[i]) % n_roles]
+        
+        example_json = _render_example_json(
+            ex_role,
+            [ex_role, other_role],
+            ex_industry,
+            years[i],
+            is_technical[i],
+            _EDUCATION_LEVELS[education_idx[i]],
+            [_TECH_OPTIONS[j] for j in tech_idx[i][:tech_k[i]]],
+            [_STRENGTHS[j] for j in strengths_idx[i]],
+            [_WEAKNESSES[j] for j in weaknesses_idx[i]],
+            traits[i]
+        )
+        hint_text = _build_hints(suggested_role, suggested_industry)
+        prompts.append(_render_prompt(bio, job_title, age, gender, hint_text, example_json))
+    
+    return prompts
+
+
+def _build_prompts_chunk(args: Tuple[Sequence, Sequence, np.random.SeedSequence]) -> List[str]:
+    """
+    Worker entry point for build_prompts_parallel.
+    
+    Args:
+        args: (rows, hints, seed_sequence) for one chunk
+    
+    Returns:
+        Prompts for the chunk
+    """
+    rows, hints, seed_sequence = args
+    return build_prompts_batch(rows, hints, rng=np.random.default_rng(seed_sequence))
+
+
+def build_prompts_parallel(
+    rows: Sequence[Tuple[str, str, int, str]],
+    hints: Optional[Sequence[Tuple[Optional[str], Optional[str]]]] = None,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 1024
+) -> List[str]:
+    """
+    Build single-profile prompts for many rows across a process pool.
+    
+    Rows are split into chunks of `chunksize`, and each chunk is rendered by
+    build_prompts_batch with its own generator spawned from `seed`. The
+    prompts therefore depend only on the rows, hints, seed and chunksize, not
+    on the number of workers. A single chunk is built in-process.
+    
+    Args:
+        rows: Sequence of (bio, job_title, age, gender) tuples
+        hints: Optional (suggested_role, suggested_industry) per row
+        seed: Seed for the example values (None for fresh entropy)
+        workers: Number of worker processes (defaults to os.cpu_count())
+        chunksize: Rows per task; large enough to amortize pickling
+    
+    Returns:
+        List of prompt strings, aligned with rows
+    """
+    rows = list(rows)
+    hints = list(hints) if hints is not None else [(None, None)] * len(rows)
+    starts = range(0, len(rows), chunksize)
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(starts))
+    tasks = [
+        (rows[start:start + chunksize], hints[start:start + chunksize], seed_sequence)
+        for start, seed_sequence in zip(starts, seed_sequences)
+    ]
+    
+    if len(tasks) <= 1 or workers == 1:
+        chunks = map(_build_prompts_chunk, tasks)
+        return [prompt for chunk in chunks for prompt in chunk]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [prompt for chunk in executor.map(_build_prompts_chunk, tasks) for prompt in chunk]
+
+
+def iter_prompts(
+    rows: Sequence[Tuple[str, str, int, str]],
+    hints: Optional[Sequence[Tuple[Optional[str], Optional[str]]]] = None,
+    rng: Optional[np.random.Generator] = None,
+    chunksize: int = PROMPT_CHUNK_SIZE,
+    assume_clean: bool = False
+) -> Iterator[str]:
+    """
+    Lazily yield single-profile prompts, rendering `chunksize` rows at a time.
+    
+    Lets a consumer start sending the first prompts while later ones are
+    still to be formatted. The prompts depend only on the inputs, the rng
+    state and `chunksize`, not on how fast they are consumed. Every chunk
+    draws example values for a full `chunksize` rows, so a prompt depends on
+    its own row and position only: appending rows leaves earlier prompts
+    unchanged, while inserting or removing rows changes the later ones.
+    
+    Args:
+        rows: Sequence of (bio, job_title, age, gender) tuples
+        hints: Optional (suggested_role, suggested_industry) per row
+        rng: Optional NumPy generator (defaults to a fresh unseeded one)
+        chunksize: Rows rendered per vectorized build_prompts_batch call
+        assume_clean: Skip the missing-value cleaning when the inputs are
+            already cleaned (e.g. column-wise by the caller)
+    
+    Yields:
+        Prompt strings, aligned with rows
+    """
+    if hints is None:
+        hints = [(None, None)] * len(rows)
+    if rng is None:
+        rng = np.random.default_rng()
+    for start in range(0, len(rows), chunksize):
+        yield from build_prompts_batch(
+            rows[start:start + chunksize],
+            hints[start:start + chunksize],
+            rng=rng,
+            assume_clean=assume_clean,
+            draw_rows=chunksize
+        )